@@ -4,12 +4,9 @@ import logging
 import time  # Used for simulating a delay in streaming
 from flask import Blueprint, request, Response, jsonify
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
-import instructor
-from openai import OpenAI
 from dotenv import load_dotenv
-from app.rag import pinecone_rag
-from groq import Groq
-from pinecone import Pinecone
+from app import clients, event_loop, metrics
+from app.rag import pinecone_rag, pipeline, response_cache
 from app.functions.get_custom_llm_streaming import generate_user_uuid, augment_system_lists
 from app.rag.db import get_user_by_email, get_user_by_id, add_color_to_user, change_char, check_if_user_exists, create_user
 
@@ -19,18 +16,17 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 finalize_details_args = []
 
-pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
-user_index = pc.Index("user-data-openai-embedding")
-book_index = pc.Index("ah-test")
+# Optional acknowledgement sent as the first SSE chunk, before classification and retrieval
+ACK_ENABLED = os.getenv("CUSTOM_LLM_ACK_ENABLED", "false").lower() == "true"
+ACK_TEXT = os.getenv("CUSTOM_LLM_ACK_TEXT", "Let me think about that. ")
 
 custom_llm = Blueprint('custom_llm', __name__)
 
 # client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
 # client = Groq(api_key=os.getenv("GROQ_API_KEY"))
 
-# OpenAI Client
-client_openai = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-client_openai_instructor = instructor.from_openai(client_openai)
+# OpenAI and Pinecone clients come from the shared registry (app/clients.py);
+# the async client is for routes that run on the shared event loop
 
 
 @custom_llm.route('/token', methods=['POST'])
@@ -240,9 +236,88 @@ async def openai_advanced_chat_completions_route_new():
     """Handle POST requests for advanced OpenAI chat completions."""
     # Parse incoming request data
     request_data = request.get_json()
+    with metrics.request_timer() as timings:
+        body, status, content_type = await advanced_chat_completion(
+            request_data)
+    response = to_flask_response(body, status, content_type)
+    if timings:
+        response.headers['Server-Timing'] = metrics.server_timing_header(timings)
+    return response
+
+
+async def advanced_chat_completion(request_data):
+    """
+    Framework-neutral core of the advanced chat completions route, shared by the
+    Flask view and the native ASGI handler in app/asgi.py.
+
+    With CUSTOM_LLM_ACK_ENABLED, streaming requests start their response right
+    away with an acknowledgement chunk and the real stream is spliced in after it.
+
+    Returns:
+        tuple: (body, status, content_type). body is a dict for JSON responses, a
+        string, or a sync/async iterator of SSE lines for streaming responses.
+    """
+    if ACK_ENABLED and wants_stream(request_data):
+        return acknowledge_then_stream(request_data, time.perf_counter()), 200, 'text/event-stream'
+    return await _advanced_chat_completion(request_data)
+
+
+def wants_stream(request_data) -> bool:
+    """Whether a request will be answered with an SSE stream (model set, messages present, streaming on)."""
+    return bool(request_data.get("model") and request_data.get("messages")
+                and request_data.get("message", {}).get("analysis", {}).get("streaming", True))
+
+
+def acknowledgement_chunk(model: str, text: str = ACK_TEXT) -> str:
+    """An SSE line in OpenAI chat.completion.chunk format carrying the acknowledgement text."""
+    chunk = {
+        "id": f"chatcmpl-ack-{int(time.time() * 1000)}",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "delta": {
+                "role": "assistant",
+                "content": text
+            },
+            "finish_reason": None
+        }]
+    }
+    return f"data: {json.dumps(chunk)}\n\n"
+
+
+async def acknowledge_then_stream(request_data, accepted: float):
+    """
+    Yield the acknowledgement chunk immediately, then run classification, retrieval
+    and the upstream call and splice in their stream.
+    The acknowledgement is timed as ack_ttft, from accepted (perf_counter() when the
+    request was accepted) until the chunk is handed to the server, separately from upstream_ttft.
+    """
+    ack = acknowledgement_chunk(request_data.get("model", ""))
+    metrics.record("ack_ttft", time.perf_counter() - accepted)
+    yield ack
+
+    with metrics.request_timer():
+        body, status, content_type = await _advanced_chat_completion(
+            request_data)
+
+    if status != 200 or content_type != 'text/event-stream':
+        # The response has already started, so the error can only be logged
+        logger.error(f"Chat completion failed after acknowledgement: {body}")
+        return
+    if hasattr(body, '__aiter__'):
+        async for line in body:
+            yield line
+    else:
+        for line in body:
+            yield line
+
+
+async def _advanced_chat_completion(request_data):
     # print(request_data)
     if not request_data.get("model", []):
-        return jsonify({"error": "No JSON data provided in the request."}), 400
+        return {"error": "No JSON data provided in the request."}, 400, 'application/json'
 
     # Log the incoming request data for debugging
     timestamp = request_data.get("message", {}).get("timestamp", time.time())
@@ -271,22 +346,22 @@ async def openai_advanced_chat_completions_route_new():
             query_string = messages[-1]['content']
             if query_string.lower() in ["help", "what can i ask?"]:
                 assistance_text = provide_interaction_assistance()
-                return Response(
-                    generate_streaming_introduction(assistance_text),
-                    content_type='text/event-stream')
+                return generate_streaming_introduction(
+                    assistance_text), 200, 'text/event-stream'
 
-            # Classify the input to determine context
+            # Classify the input and retrieve context concurrently
             atomic_habits_keywords = [
                 "habit", "Atomic Habits", "James Clear", "self-improvement",
                 "routine", "productivity"
             ]
-            classification_result = pinecone_rag.classify(
-                query_string, atomic_habits_keywords)
-            classification_label = classification_result.label
+            retrieval = await pipeline.retrieve_context(
+                query_string, atomic_habits_keywords, clients.get_user_index(),
+                clients.get_book_index())
+            classification_label = retrieval["label"]
+            contexts = retrieval["contexts"]
+            context_ids = retrieval["context_ids"]
+            query_embedding = retrieval["embedding"]
 
-            # Get embedding for the query string
-            # embedding = pinecone_rag.get_embedding(query_string)
-            # print(query_string,embedding)
             # Metadata Format:
             # metadata{
             #         "data":{
@@ -300,31 +375,15 @@ async def openai_advanced_chat_completions_route_new():
             # email_address = request_data.get("metadata", {}).get("data", {}).get("user", {}).get('email', 'unknown')
             # user_name = request_data.get("metadata",{}).get("data", {}).get("user", {}).get('username', 'unknown')
 
-            user_name = request_data.get('metadata', []).get('user_id', [])
-            email_address = request_data.get('metadata', []).get('user_id', [])
+            # Vapi sends one caller id, used as both name and email; it alone identifies the user
+            caller_id = (request_data.get('metadata') or {}).get('user_id')
+            user_name = caller_id or []
+            email_address = caller_id or []
 
             user_id = generate_user_uuid(user_name, email_address)
 
-            # Vector context retrieval based on classification
-            contexts = []
-            if classification_label == "PERSONAL":
-                # user_index = "user-data-openai-embedding"  # Specify the user index
-                res = pinecone_rag.query_pinecone_user(
-                    query_string,
-                    user_index,
-                    top_k=1,
-                    namespace='user-data-openai-embedding')
-                contexts.extend(
-                    [x['metadata']['text'] for x in res['matches']])
-                # print("******USER CONTEXT*********",contexts)
-            elif classification_label == "ATOMIC_HABITS":
-                # book_index = "ah-test"  # Specify the book index
-                context_strings = pinecone_rag.query_pinecone_book(
-                    query_string, book_index, top_k=1, namespace='ah-test')
-                # contexts.extend([x['metadata']['text'] for x in res['matches']])
-                contexts.extend(context_strings)
-                # print("******BOOK CONTEXT*********",contexts)
             # Retrieve email for system message
+            prompt_start = time.perf_counter()
 
             conversation = []
 
@@ -334,6 +393,23 @@ async def openai_advanced_chat_completions_route_new():
 
             conversation = augment_system_lists(system_message, messages)
 
+            # Replay a cached answer for a near-identical question with the same
+            # context, in a conversation identical up to that question (the last message)
+            cache_scope = response_cache.cache_scope(classification_label,
+                                                     caller_id,
+                                                     conversation[:-1])
+            use_cache = stream and response_cache.cache_enabled(
+            ) and cache_scope is not None and query_embedding is not None
+            if use_cache:
+                cached_answer = response_cache.get_response_cache().lookup(
+                    query_embedding,
+                    classification_label,
+                    context_ids,
+                    scope=cache_scope)
+                if cached_answer is not None:
+                    return generate_streaming_introduction(
+                        cached_answer), 200, 'text/event-stream'
+
             prompt_end = "The following may or may not be relevant information from past conversations. If it is not relevant to this conversation, ignore it:\n\n"
             prompt = query_string + "\n\n" + prompt_end + "\n\n---\n\n".join(
                 contexts[:1])
@@ -354,36 +430,52 @@ async def openai_advanced_chat_completions_route_new():
                 "stream": stream,
                 "tools": tools,
             }
+            metrics.record("prompt_assembly",
+                           time.perf_counter() - prompt_start)
 
             # Handle streaming and non-streaming cases
             if stream:
-                chat_completion_stream = client_openai.chat.completions.create(
+                upstream_start = time.perf_counter()
+                chat_completion_stream = await clients.get_async_openai(
+                ).chat.completions.create(
                     **llm_request_data)
-                return Response(
-                    generate_streaming_response(chat_completion_stream),
-                    content_type='text/event-stream')
+                on_complete = None
+                if use_cache:
+                    on_complete = lambda answer: response_cache.get_response_cache(
+                    ).store(query_embedding,
+                            classification_label,
+                            context_ids,
+                            answer,
+                            scope=cache_scope)
+                return agenerate_streaming_response(
+                    chat_completion_stream,
+                    on_complete=on_complete,
+                    timings=metrics.current_timings(),
+                    upstream_start=upstream_start), 200, 'text/event-stream'
             else:
-                chat_completion = client_openai.chat.completions.create(
-                    **llm_request_data)
-                return Response(chat_completion.model_dump_json(),
-                                content_type='application/json')
+                with metrics.span("upstream_completion"):
+                    chat_completion = await clients.get_async_openai(
+                    ).chat.completions.create(
+                        **llm_request_data)
+                return chat_completion.model_dump_json(
+                ), 200, 'application/json'
 
         except ValueError as ve:
             logger.error(f"ValueError: {str(ve)}")
-            return jsonify({"error": str(ve)}), 400
+            return {"error": str(ve)}, 400, 'application/json'
         except Exception as e:
             logger.error(f"Unexpected error: {str(e)}", exc_info=True)
-            return jsonify({
+            return {
                 "error":
                 "An unexpected error occurred. Please try again later."
-            }), 500
+            }, 500, 'application/json'
     else:
         pass
     # If the model field is empty or missing, return a 400 response
-    return jsonify({
+    return {
         "message":
         "Model field is empty or not provided. No operation performed."
-    }), 400
+    }, 400, 'application/json'
 
 
 # @custom_llm.route('/finalizeDetails', methods=['POST'])
@@ -499,14 +591,14 @@ def custom_llm_openai_sse_handler():
     if streaming:
         # Simulate a stream of responses
 
-        chat_completion_stream = client_openai.chat.completions.create(
+        chat_completion_stream = clients.get_openai().chat.completions.create(
             **request_data)
 
         return Response(generate_streaming_response(chat_completion_stream),
                         content_type='text/event-stream')
     else:
         # Simulate a non-streaming response
-        chat_completion = client_openai.chat.completions.create(**request_data)
+        chat_completion = clients.get_openai().chat.completions.create(**request_data)
         return Response(chat_completion.model_dump_json(),
                         content_type='application/json')
 
@@ -522,7 +614,7 @@ def openai_advanced_custom_llm_route():
     ----------
     PROMPT: {last_message['content']}.
     MODIFIED PROMPT: """
-    completion = client_openai.completions.create(
+    completion = clients.get_openai().completions.create(
         model="gpt-3.5-turbo-instruct",
         prompt=prompt,
         max_tokens=500,
@@ -537,14 +629,14 @@ def openai_advanced_custom_llm_route():
     request_data['messages'] = modified_message
     print(request_data)
     if streaming:
-        chat_completion_stream = client_openai.chat.completions.create(
+        chat_completion_stream = clients.get_openai().chat.completions.create(
             **request_data)
 
         return Response(generate_streaming_response(chat_completion_stream),
                         content_type='text/event-stream')
     else:
         # Simulate a non-streaming response
-        chat_completion = client_openai.chat.completions.create(**request_data)
+        chat_completion = clients.get_openai().chat.completions.create(**request_data)
         return Response(chat_completion.model_dump_json(),
                         content_type='application/json')
 
@@ -563,14 +655,75 @@ def provide_interaction_assistance() -> str:
     return assistance_text
 
 
-def generate_streaming_response(data):
+def generate_streaming_response(data, on_complete=None):
     """
   Generator function to simulate streaming data.
+  If on_complete is given it receives the full answer text once the stream
+  finishes, unless the model answered with tool calls.
   """
+    answer_parts = []
+    has_tool_calls = False
     for message in data:
+        if on_complete is not None and message.choices:
+            delta = message.choices[0].delta
+            if delta.content:
+                answer_parts.append(delta.content)
+            if delta.tool_calls:
+                has_tool_calls = True
         json_data = message.model_dump_json()
         yield f"data: {json_data}\n\n"
 
+    if on_complete is not None and not has_tool_calls:
+        on_complete("".join(answer_parts))
+
+
+async def agenerate_streaming_response(data,
+                                       on_complete=None,
+                                       timings=None,
+                                       upstream_start=None):
+    """
+  Async counterpart of generate_streaming_response for AsyncOpenAI streams.
+  Records upstream time-to-first-token and stream duration, and sends the
+  request's stage timings as a trailing SSE comment when timings is given.
+  """
+    answer_parts = []
+    has_tool_calls = False
+    stream_start = upstream_start or time.perf_counter()
+    first_chunk = True
+    async for message in data:
+        if first_chunk:
+            metrics.record_into(timings, "upstream_ttft",
+                                time.perf_counter() - stream_start)
+            first_chunk = False
+        if on_complete is not None and message.choices:
+            delta = message.choices[0].delta
+            if delta.content:
+                answer_parts.append(delta.content)
+            if delta.tool_calls:
+                has_tool_calls = True
+        json_data = message.model_dump_json()
+        yield f"data: {json_data}\n\n"
+
+    if on_complete is not None and not has_tool_calls:
+        on_complete("".join(answer_parts))
+
+    metrics.record_into(timings, "stream_duration",
+                        time.perf_counter() - stream_start)
+    if timings is not None and metrics.METRICS_ENABLED:
+        yield metrics.sse_trailer(timings)
+
+
+def to_flask_response(body, status, content_type):
+    """Turn an (body, status, content_type) result into a Flask response."""
+    if isinstance(body, dict):
+        response = jsonify(body)
+        response.status_code = status
+        return response
+    if hasattr(body, '__aiter__'):
+        # Async SSE generators keep running on the shared event loop
+        body = event_loop.iterate(body)
+    return Response(body, status=status, content_type=content_type)
+
 
 def generate_streaming_introduction(data: str):
     """
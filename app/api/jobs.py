@@ -0,0 +1,17 @@
+from flask import Blueprint, jsonify
+from app.job_queue import get_job_queue
+
+# Initialize Blueprint
+jobs = Blueprint('jobs', __name__)
+
+
+@jobs.get('/<job_id>')
+def job_status(job_id):
+    """
+    Status of a background job: queued, running, succeeded or failed,
+    with its progress and, once finished, its result or error.
+    """
+    job = get_job_queue().get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job), 200
@@ -1,6 +1,7 @@
 import os
 import requests
 from flask import Blueprint, request, jsonify
+from app import clients
 
 outbound_bp = Blueprint('outbound_api', __name__)
 
@@ -19,7 +20,7 @@ def outbound_route():
         # Handle Outbound Call logic here.
         # This can initiate an outbound call to a customer's phonenumber using Vapi.
 
-        response = requests.post(
+        response = clients.get_http_session().post(
             f"{VAPI_BASE_URL}/call/phone",
             headers={
                 "Content-Type": "application/json",
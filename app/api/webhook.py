@@ -1,13 +1,13 @@
 from flask import Blueprint, request, jsonify
 import json
 import logging
-import sqlite3
 import os
-from pathlib import Path
 import asyncio
+import msgspec
 from app.functions import get_character_inspiration_tool, get_random_name
 from app.rag import pinecone_rag
-from app.functions.schedule_clickup import generate_schedule, process_schedule, transform_llm_output
+from app.functions.schedule_clickup import (Schedule, generate_schedule, process_schedule, transform_llm_output,
+                                            stream_and_process_schedule, SCHEDULE_STREAMING)
 from app.functions.get_custom_llm_streaming import generate_user_uuid
 import time
 from app.vapi_message_handlers.conversation_update import ConversationUpdate
@@ -15,83 +15,60 @@ from app.vapi_message_handlers.end_of_call_report import EndOfCallReport
 from app.vapi_message_handlers.model_output import ModelOutput
 from app.vapi_message_handlers.speech_update import SpeechUpdate
 from app.vapi_message_handlers.transcript import Transcript
+from app.types.webhook import decode_webhook, DecodeError
+from app.payload_logger import PayloadLogger
+from app.sqlite_writer import SQLiteWriter
+from app.seen_tool_calls import SeenToolCalls
+from app.job_queue import get_job_queue
 
 
 # Constants
-LOG_FILE_PATH = "/Users/clydeclarke/Documents/server-example-python-flask/app/response_data/webhook_logs.txt"
+LOG_FILE_PATH = os.getenv("WEBHOOK_LOG_PATH", "app/response_data/webhook_logs.jsonl")
 LOG_TOOL_PATH = "/Users/clydeclarke/Documents/server-example-python-flask/app/response_data/tool_logs.txt"
 DB_BASE_PATH = "data/databases"
-
-# Pinecone Indexes
-pinecone_rag.user_index
-pinecone_rag.book_index
-
-# Pinecone Client
-pinecone_rag.client
+TOOL_CONCURRENCY = int(os.getenv("TOOL_CONCURRENCY", 8))  # tool calls run at once per payload
+TOOL_TIMEOUT = float(os.getenv("TOOL_TIMEOUT", 20))  # seconds, unless the tool registers its own
+
+# Raw payloads are written as JSONL by a background thread (app/payload_logger.py)
+payload_log = PayloadLogger(LOG_FILE_PATH)
+
+# Tables tool-call arguments are stored in, keyed by tool name
+TOOL_TABLES = {
+    "collect_user_info": {
+        "db": f"{DB_BASE_PATH}/preferences.db",
+        "table": "user_preferences",
+        "schema": "id INTEGER PRIMARY KEY AUTOINCREMENT, key TEXT, value TEXT, description TEXT",
+    },
+    "finalizeDetails": {
+        "db": f"{DB_BASE_PATH}/details.db",
+        "table": "finalized_details",
+        "schema": "id INTEGER PRIMARY KEY AUTOINCREMENT, summary TEXT, details TEXT",
+    },
+    "getCharacterInspiration": {
+        "db": f"{DB_BASE_PATH}/characters.db",
+        "table": "character_inspirations",
+        "schema": "id INTEGER PRIMARY KEY AUTOINCREMENT, theme TEXT, setting TEXT, traits TEXT",
+    },
+}
+
+# Long-lived WAL connections with write-behind batching (app/sqlite_writer.py);
+# the tables are created at startup (app/warmup.py), not on import
+tool_store = SQLiteWriter()
+for _tool_name, _db_info in TOOL_TABLES.items():
+    tool_store.register_table(_tool_name, _db_info["db"], _db_info["table"], _db_info["schema"])
+
+# Tool call ids already dispatched, per call (app/seen_tool_calls.py)
+seen_tool_calls = SeenToolCalls()
+
+# Slow tools run as persistent background jobs (app/job_queue.py); the queue
+# opens its database when its workers start at startup, not here
+job_queue = get_job_queue()
 
 # Initialize Blueprint
 webhook = Blueprint('webhook', __name__)
 # Dictionary to register tool handlers
 tool_handlers = {}
-
-def init_database_directory():
-    """
-    Initialize the database directory at startup
-    """
-    Path(DB_BASE_PATH).mkdir(parents=True, exist_ok=True)
-def ensure_db_directory(db_path):
-    """
-    Ensure the directory for the database exists.
-    """
-    db_dir = os.path.dirname(db_path)
-    if db_dir:
-        Path(db_dir).mkdir(parents=True, exist_ok=True)
-def store_in_database(data, db_name, table_name, schema):
-    """
-    Store extracted data into a SQLite database with dynamic table creation.
-    Handles AUTOINCREMENT columns automatically.
-    """
-    try:
-        ensure_db_directory(db_name)
-        conn = sqlite3.connect(db_name)
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute(f"CREATE TABLE IF NOT EXISTS {table_name} ({schema})")
-        except sqlite3.OperationalError as e:
-            logging.error(f"Error creating table {table_name}: {e}")
-            conn.close()
-            return False
-
-        if data:
-            # Filter out AUTOINCREMENT columns for INSERT
-            columns = ", ".join(
-                col.split()[0] for col in schema.split(",")
-                if "AUTOINCREMENT" not in col.upper()
-            )
-            placeholders = ", ".join("?" for _ in data[0])
-
-            try:
-                cursor.executemany(
-                    f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})",
-                    data
-                )
-                conn.commit()
-            except sqlite3.Error as e:
-                logging.error(f"Error inserting data into {table_name}: {e}")
-                conn.rollback()
-                conn.close()
-                return False
-
-        conn.close()
-        return True
-
-    except sqlite3.Error as e:
-        logging.error(f"Database error: {e}")
-        return False
-    except Exception as e:
-        logging.error(f"Unexpected error: {e}")
-        return False
+tool_timeouts = {}
 
 @webhook.route('/', methods=['POST'])
 async def webhook_route():
@@ -99,20 +76,19 @@ async def webhook_route():
     Main webhook route handler
     """
     try:
-        request_data = request.get_json()
-        payload = request_data.get('message')
+        # Decode only the fields the handlers read (app/types/webhook.py); the
+        # call history that makes these payloads large is skipped, not parsed
+        body = request.get_data()
+        try:
+            payload = decode_webhook(body).message
+        except DecodeError as e:
+            return jsonify({"error": f"Invalid payload: {e}"}), 400
 
         if not payload:
             return jsonify({"error": "No message in payload"}), 400
 
-        log_entry = (
-            f"Payload Type: {payload.get('type')}\n"
-            f"Payload Keys: {list(payload.keys())}\n"
-            f"Payload Content: {payload}\n"
-            f"{'='*50}\n"
-        )
-        with open(LOG_FILE_PATH, "a") as log_file:
-            log_file.write(log_entry)
+        # Queued for the background writer; sampled or dropped rather than blocking
+        payload_log.log(payload.type, body)
 
         handlers = {
             "function-call": function_call_handler,
@@ -125,14 +101,17 @@ async def webhook_route():
             "speech-update": speech_update_handler,
             "hang": hang_event_handler,
             "voice-input": voice_input_handler,
-            "model-output": lambda p: p
+            "model-output": lambda p: msgspec.to_builtins(p)
         }
 
-        payload_type = payload.get('type')
+        payload_type = payload.type
         handler = handlers.get(payload_type)
 
+        if payload_type == "tool-calls":
+            # Only tool calls not dispatched on an earlier webhook of this call run and get stored
+            payload = await drop_seen_tool_calls(payload)
+
         if handler:
-            import asyncio
             if asyncio.iscoroutinefunction(handler):
                 response = await handler(payload)  # ✅ Corrected with await
             else:
@@ -149,12 +128,41 @@ async def webhook_route():
         logging.error(f"An error occurred ok: {str(e)}")
         return jsonify({"error": "An unexpected error occurred."}), 500
 
-def register_tool_handler(tool_name):
+async def drop_seen_tool_calls(payload):
+    """
+    Return the payload with every tool call already dispatched for this call removed,
+    from both artifact.messages (the whole history) and toolCalls.
+    """
+    call_id = payload.call.id if payload.call else None
+    tool_call_ids = {call.id for message in payload.artifact.messages for call in message.toolCalls if call.id}
+    tool_call_ids.update(call.id for call in payload.toolCalls if call.id)
+    if not call_id or not tool_call_ids:
+        return payload
+
+    new_ids = await seen_tool_calls.aclaim(call_id, tool_call_ids)
+
+    def keep(calls):
+        # Calls without an id cannot be matched up, so they are always kept
+        return [call for call in calls if not call.id or call.id in new_ids]
+
+    messages = [
+        msgspec.structs.replace(message, toolCalls=keep(message.toolCalls)) if message.toolCalls else message
+        for message in payload.artifact.messages
+    ]
+    return msgspec.structs.replace(
+        payload,
+        toolCalls=keep(payload.toolCalls),
+        artifact=msgspec.structs.replace(payload.artifact, messages=messages))
+
+
+def register_tool_handler(tool_name, timeout=None):
     """
-    Decorator to register tool handlers
+    Decorator to register tool handlers, optionally with their own timeout in seconds
     """
     def decorator(func):
         tool_handlers[tool_name] = func
+        if timeout is not None:
+            tool_timeouts[tool_name] = timeout
         return func
     return decorator
 def extract_tool_calls(payload):
@@ -162,12 +170,11 @@ def extract_tool_calls(payload):
     Extract tool call data from the payload and categorize it by tool type.
     """
     extracted_data = {}
-    tool_calls = payload.get("toolCalls", [])
+    tool_calls = payload.toolCalls
     
     for call in tool_calls:
-        function_data = call.get("function", {})
-        tool_name = function_data.get("name")
-        arguments = function_data.get("arguments", {})
+        tool_name = call.function.name
+        arguments = call.function.arguments if call.function.arguments is not None else {}
 
         if isinstance(arguments, str):
             try:
@@ -209,17 +216,19 @@ def extract_tool_calls(payload):
 async def tool_call_handler(payload):
     """
     Generalized handler for processing tool calls in a payload.
+    Independent tool calls run concurrently (at most TOOL_CONCURRENCY at a time),
+    each under its own timeout; results keep the order of the calls.
     """
-    artifact_messages = payload.get("artifact", {}).get("messages", [])
-    results = []
+    artifact_messages = payload.artifact.messages
+    semaphore = asyncio.Semaphore(TOOL_CONCURRENCY)
+    calls = []
 
     for message in artifact_messages:
-        tool_calls = message.get("toolCalls", [])
+        tool_calls = message.toolCalls
         for call in tool_calls:
-            tool_call_id = call.get("id", "")
-            function = call.get("function", {})
-            tool_name = function.get("name")
-            arguments = function.get("arguments", {})
+            tool_call_id = call.id
+            tool_name = call.function.name
+            arguments = call.function.arguments if call.function.arguments is not None else {}
 
             # Parse arguments if provided as a string
             if isinstance(arguments, str):
@@ -231,58 +240,63 @@ async def tool_call_handler(payload):
 
             handler = tool_handlers.get(tool_name)
 
-            # ✅ Fixed async handling check
             if handler:
-                import asyncio
-                if asyncio.iscoroutinefunction(handler):
-                    result = await handler(tool_call_id, **arguments)
-                else:
-                    result = handler(tool_call_id, **arguments)
-                results.append(result)
+                calls.append(run_tool(handler, tool_name, tool_call_id, arguments, semaphore))
             else:
                 logging.warning(f"No handler registered for tool {tool_name}")
 
-    return results
+    return list(await asyncio.gather(*calls))
+
+
+async def run_tool(handler, tool_name, tool_call_id, arguments, semaphore):
+    """
+    Run one tool handler under its timeout. A timeout or error becomes a fallback
+    result for that tool instead of failing the whole payload.
+    """
+    timeout = tool_timeouts.get(tool_name, TOOL_TIMEOUT)
+    async with semaphore:
+        try:
+            if asyncio.iscoroutinefunction(handler):
+                call = handler(tool_call_id, **arguments)
+            else:
+                # Sync handlers run in a worker thread so they do not block the other tools
+                call = asyncio.to_thread(handler, tool_call_id, **arguments)
+            return await asyncio.wait_for(call, timeout)
+        except asyncio.TimeoutError:
+            logging.error(f"Tool {tool_name} ({tool_call_id}) timed out after {timeout}s")
+            return {
+                "tool": tool_name,
+                "status": "timeout",
+                "message": f"{tool_name} did not finish within {timeout} seconds."
+            }
+        except Exception as e:
+            logging.error(f"Error in tool {tool_name} ({tool_call_id}): {e}")
+            return {
+                "tool": tool_name,
+                "status": "error",
+                "message": str(e)
+            }
 async def process_tool_calls(payload):
     """
     Process tool calls, extract data, and store it in respective databases.
     """
     extracted_data = extract_tool_calls(payload)
 
-    db_mappings = {
-        "collect_user_info": {
-            "db": f"{DB_BASE_PATH}/preferences.db",
-            "table": "user_preferences",
-            "schema": "id INTEGER PRIMARY KEY AUTOINCREMENT, key TEXT, value TEXT, description TEXT",
-        },
-        "finalizeDetails": {
-            "db": f"{DB_BASE_PATH}/details.db",
-            "table": "finalized_details",
-            "schema": "id INTEGER PRIMARY KEY AUTOINCREMENT, summary TEXT, details TEXT",
-        },
-        "getCharacterInspiration": {
-            "db": f"{DB_BASE_PATH}/characters.db",
-            "table": "character_inspirations",
-            "schema": "id INTEGER PRIMARY KEY AUTOINCREMENT, theme TEXT, setting TEXT, traits TEXT",
-        },
-    }
-
+    # Rows are batched with other requests' rows into one transaction per database
+    writes = {}
     for tool_name, data in extracted_data.items():
-        if tool_name in db_mappings:
-            db_info = db_mappings[tool_name]
-            success = store_in_database(
-                data,
-                db_name=db_info["db"],
-                table_name=db_info["table"],
-                schema=db_info["schema"]
-            )
-            if success:
-                logging.info(f"Data for '{tool_name}' successfully stored in {db_info['db']} -> {db_info['table']}.")
-            else:
-                logging.error(f"Failed to store data for '{tool_name}' in {db_info['db']}.")
+        if tool_name in TOOL_TABLES:
+            writes[tool_name] = asyncio.wrap_future(tool_store.submit(tool_name, data))
         else:
             logging.warning(f"No database mapping found for tool: {tool_name}")
 
+    for tool_name, write in writes.items():
+        db_info = TOOL_TABLES[tool_name]
+        if await write:
+            logging.info(f"Data for '{tool_name}' successfully stored in {db_info['db']} -> {db_info['table']}.")
+        else:
+            logging.error(f"Failed to store data for '{tool_name}' in {db_info['db']}.")
+
 ## Tool Handlers
 @register_tool_handler("finalizeDetails")
 async def handle_finalize_details(tool_call_id, question, answer):
@@ -346,48 +360,77 @@ async def handle_get_character_inspiration(tool_call_id, theme=None, setting=Non
 async def handle_schedule_clickup(tool_call_id, goal,timeline,resources, space_id=90112974722):
     """
     Handler for schedule_clickup tool.
+    Queues the schedule job (app/job_queue.py) and returns its id straight away;
+    progress can be polled at /api/jobs/<job_id>.
+    """
+    job_id = await job_queue.aenqueue("schedule_clickup", {
+        "tool_call_id": tool_call_id,
+        "prompt": goal + timeline + resources,
+        "space_id": space_id,
+    })
+    return {
+        "tool": "schedule_clickup",
+        "status": "queued",
+        "job_id": job_id,
+        "message": "The schedule is being created in ClickUp in the background."
+    }
+
+
+@job_queue.register("schedule_clickup")
+async def run_schedule_clickup(job, context):
+    """
+    Background job for schedule_clickup.
     Generates a schedule using an LLM and integrates it with ClickUp.
+    The schedule and the ClickUp ids created for it are checkpointed in the job's
+    progress, so a rerun after the worker stopped (app/job_queue.py) finishes the
+    same schedule instead of generating and creating a second one.
     """
-    try:
-        # Log the received request
-        # logging.info(f"Processing schedule_clickup tool call: {tool_call_id}, prompt: {goal}")
-        prompt = goal + timeline + resources
-        # Generate the schedule
-        raw_schedule = await generate_schedule(prompt)
+    previous_ids = context.progress.get("clickup_ids")
+    if "schedule" in context.progress:
+        # Rerun: build the recorded schedule, reusing everything already created for it
+        validated_schedule = Schedule.model_validate(context.progress["schedule"])
+        await process_schedule(space_id=job["space_id"], schedule=validated_schedule, progress=context.report,
+                               clickup_ids=previous_ids, checkpoint=context.checkpoint)
+    elif previous_ids:
+        # Lists streamed before the worker stopped exist, but the rest of that schedule was never received
+        raise RuntimeError("An earlier attempt stopped while the schedule was being generated and left part of it "
+                           "in ClickUp; not creating another copy")
+    elif SCHEDULE_STREAMING:
+        # Lists are created in ClickUp while the rest of the schedule is still being generated
+        validated_schedule = await stream_and_process_schedule(job["space_id"], job["prompt"], progress=context.report,
+                                                               checkpoint=context.checkpoint)
+    else:
+        context.report(stage="generating")
+        raw_schedule = await generate_schedule(job["prompt"])
         validated_schedule = transform_llm_output(raw_schedule)
+        context.report(schedule_name=validated_schedule.schedule_name, schedule=validated_schedule.model_dump())
+        await context.checkpoint()
 
         # Process the schedule and integrate with ClickUp
-        await process_schedule(space_id=space_id, schedule=validated_schedule)
+        await process_schedule(space_id=job["space_id"], schedule=validated_schedule, progress=context.report,
+                               checkpoint=context.checkpoint)
+    context.report(stage="done")
 
-        return {
-            "tool": "schedule_clickup",
-            "status": "success",
-            "schedule_name": validated_schedule.schedule_name,
-            "message": f"Schedule '{validated_schedule.schedule_name}' successfully created in ClickUp."
-        }
-    except Exception as e:
-        logging.error(f"Error in handle_schedule_clickup: {e}")
-        return {
-            "tool": "schedule_clickup",
-            "status": "error",
-            "message": str(e)
-        }
+    return {
+        "schedule_name": validated_schedule.schedule_name,
+        "message": f"Schedule '{validated_schedule.schedule_name}' successfully created in ClickUp."
+    }
 
 # Other handlers remain the same
 async def function_call_handler(payload):
     """Handle function calls."""
-    function_call = payload.get('toolCall')
+    function_call = payload.toolCall
     if not function_call:
         raise ValueError("Invalid Request.")
     
-    name = function_call.get('name')
-    parameters = function_call.get('parameters')
+    name = function_call.name
+    parameters = function_call.parameters or {}
 
     if name == 'getCharacterInspiration':
-        return get_character_inspiration_tool.get_character_inspiration(**parameters)
+        return await asyncio.to_thread(get_character_inspiration_tool.get_character_inspiration, **parameters)
     elif name == 'getRandomName':
         params = get_random_name.NameParams(gender="male", nat="US")
-        return get_random_name.get_random_name(params)
+        return await get_random_name.get_random_name(params)
     return None
 
 async def status_update_handler(payload):
@@ -409,8 +452,8 @@ async def end_of_call_report_handler(payload):
     # summary_embedding = pinecone_rag.get_embedding(summarization)
     # # print(summarization)
 
-    user_id = payload.get('assistant',[]).get('metadata',[]).get('user_id',[])
-    summarization = payload.get('summary')
+    user_id = (payload.assistant.metadata or {}).get('user_id') if payload.assistant else None
+    summarization = payload.summary
     # summary_embedding = pinecone_rag.get_embedding(summarization)
     print(summarization)
     # idv = "id" + str(time.time())
@@ -434,7 +477,7 @@ async def hang_event_handler(payload):
 
 async def assistant_request_handler(payload):
     """Handle assistant requests."""
-    if payload and 'call' in payload:
+    if payload and payload.call is not None:
         assistant = {
             'name': 'Paula',
             'model': {
@@ -472,6 +515,3 @@ async def assistant_request_handler(payload):
         return {'assistant': assistant}
 
     raise ValueError('Invalid call details provided.')
-
-# Initialize database directory when the module loads
-init_database_directory()
\ No newline at end of file
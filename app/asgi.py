@@ -0,0 +1,105 @@
+"""
+ASGI entry point.
+
+    uvicorn app.asgi:application --workers 4
+
+The custom LLM chat completions route is served natively: its SSE stream is
+an async generator written straight to the ASGI connection from the server's
+event loop, so a streaming voice call does not hold an OS thread. Every other
+route goes through the Flask app; its async views are dispatched onto the same
+server loop, so there is one loop and one set of async clients per worker.
+Flask requests run on a thread pool (WSGI_THREADS, app/wsgi_to_asgi.py), so a
+view waiting on the loop does not hold up other requests.
+"""
+import json
+import asyncio
+import logging
+
+from app.main import app as flask_app, start_background_work
+from app import event_loop, metrics
+from app.api.custom_llm import advanced_chat_completion
+from app.wsgi_to_asgi import ThreadPoolWsgiToAsgi, read_body
+
+logger = logging.getLogger(__name__)
+
+wsgi_application = ThreadPoolWsgiToAsgi(flask_app)
+_loop_adopted = False
+
+
+async def _send_result(send, body, status: int, content_type: str, headers=()):
+    """Write an (body, status, content_type) result, streaming iterators chunk by chunk."""
+    if isinstance(body, dict):
+        body = json.dumps(body)
+
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", content_type.encode())] +
+                   [(name.encode(), value.encode()) for name, value in headers],
+    })
+
+    if isinstance(body, (str, bytes)):
+        await send({"type": "http.response.body",
+                    "body": body.encode() if isinstance(body, str) else body})
+        return
+
+    if hasattr(body, "__aiter__"):
+        async for chunk in body:
+            await send({"type": "http.response.body", "body": chunk.encode(), "more_body": True})
+    else:
+        for chunk in body:
+            await send({"type": "http.response.body", "body": chunk.encode(), "more_body": True})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def chat_completions_handler(scope, receive, send):
+    """Native ASGI version of POST /api/custom-llm/chat/completions."""
+    try:
+        request_data = json.loads(await read_body(receive) or b"null")
+    except json.JSONDecodeError:
+        request_data = None
+    if not isinstance(request_data, dict):
+        await _send_result(send, {"error": "No JSON data provided in the request."}, 400, "application/json")
+        return
+
+    with metrics.request_timer() as timings:
+        body, status, content_type = await advanced_chat_completion(request_data)
+    headers = [("server-timing", metrics.server_timing_header(timings))] if timings else []
+    await _send_result(send, body, status, content_type, headers=headers)
+
+
+native_routes = {
+    ("POST", "/api/custom-llm/chat/completions"): chat_completions_handler,
+}
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            # Warm-up runs in the background; /ready reports when it is done
+            start_background_work()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def application(scope, receive, send):
+    global _loop_adopted
+    if not _loop_adopted:
+        # Flask async views run on the server loop instead of a private one
+        event_loop.set_loop(asyncio.get_running_loop())
+        _loop_adopted = True
+
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+
+    if scope["type"] == "http":
+        handler = native_routes.get((scope["method"], scope["path"].rstrip("/")))
+        if handler is not None:
+            await handler(scope, receive, send)
+            return
+
+    await wsgi_application(scope, receive, send)
@@ -0,0 +1,142 @@
+"""
+Shared upstream clients.
+
+Every module gets its OpenAI, Pinecone, Mongo and HTTP clients from here instead
+of building its own at import time. Clients are created on first use, once per
+process (a forked worker builds its own), and keep their connection pools alive
+between requests. Their libraries are imported on first use too, which keeps
+them off the import path of app startup.
+"""
+import os
+import threading
+from typing import TYPE_CHECKING
+
+import requests
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
+
+if TYPE_CHECKING:
+    import httpx
+
+load_dotenv()
+
+# Constants
+OPENAI_POOL_SIZE = int(os.getenv("OPENAI_POOL_SIZE", 100))
+OPENAI_KEEPALIVE = int(os.getenv("OPENAI_KEEPALIVE", 20))
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", 20))
+PINECONE_POOL_THREADS = int(os.getenv("PINECONE_POOL_THREADS", 8))
+MONGO_URI = os.getenv("MONGO_URI")
+USER_INDEX_NAME = "user-data-openai-embedding"
+BOOK_INDEX_NAME = "ah-test"
+
+_clients = {}
+_clients_pid = None
+_lock = threading.RLock()
+
+
+def _get_or_create(name: str, factory):
+    """Return the named client, building it with factory() on first use in this process."""
+    global _clients, _clients_pid
+    if _clients_pid != os.getpid():
+        with _lock:
+            if _clients_pid != os.getpid():
+                _clients, _clients_pid = {}, os.getpid()
+    client = _clients.get(name)
+    if client is None:
+        with _lock:
+            client = _clients.get(name)
+            if client is None:
+                client = _clients[name] = factory()
+    return client
+
+
+def _openai_limits() -> "httpx.Limits":
+    import httpx
+
+    return httpx.Limits(max_connections=OPENAI_POOL_SIZE, max_keepalive_connections=OPENAI_KEEPALIVE)
+
+
+def get_openai():
+    """Synchronous OpenAI client with a pooled keep-alive HTTP transport."""
+    import httpx
+    from openai import OpenAI
+
+    return _get_or_create(
+        "openai",
+        lambda: OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=httpx.Client(limits=_openai_limits())))
+
+
+def get_async_openai():
+    """AsyncOpenAI client; only use it from the shared event loop (app/event_loop.py)."""
+    import httpx
+    from openai import AsyncOpenAI
+
+    return _get_or_create(
+        "async_openai",
+        lambda: AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"),
+                            http_client=httpx.AsyncClient(limits=_openai_limits())))
+
+
+def get_instructor():
+    """Instructor-patched OpenAI client for structured outputs."""
+    import instructor
+
+    return _get_or_create("instructor", lambda: instructor.from_openai(get_openai()))
+
+
+def get_async_instructor():
+    """Instructor-patched AsyncOpenAI client for structured outputs on the shared event loop."""
+    import instructor
+
+    return _get_or_create("async_instructor", lambda: instructor.from_openai(get_async_openai()))
+
+
+def get_pinecone():
+    from pinecone import Pinecone
+
+    return _get_or_create("pinecone", lambda: Pinecone(api_key=os.getenv("PINECONE_API_KEY")))
+
+
+def get_index(name: str):
+    """Pinecone index handle; each handle keeps its own connection pool."""
+    return _get_or_create(f"index:{name}", lambda: get_pinecone().Index(name, pool_threads=PINECONE_POOL_THREADS))
+
+
+def get_user_index():
+    return get_index(USER_INDEX_NAME)
+
+
+def get_book_index():
+    return get_index(BOOK_INDEX_NAME)
+
+
+def get_http_session() -> requests.Session:
+    """requests.Session with a keep-alive pool for ClickUp, Vapi and other REST calls."""
+
+    def create_session():
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    return _get_or_create("http_session", create_session)
+
+
+def get_async_http() -> "httpx.AsyncClient":
+    """Pooled async HTTP client; only use it from the shared event loop."""
+    import httpx
+
+    return _get_or_create(
+        "async_http",
+        lambda: httpx.AsyncClient(limits=httpx.Limits(max_connections=HTTP_POOL_SIZE,
+                                                      max_keepalive_connections=HTTP_POOL_SIZE)))
+
+
+def get_mongo():
+    """MongoClient for user records; pymongo clients are not fork-safe, so each process builds its own."""
+    if not MONGO_URI:
+        raise RuntimeError("MONGO_URI is not set; user records need a MongoDB connection string")
+    from pymongo import MongoClient
+
+    return _get_or_create("mongo", lambda: MongoClient(MONGO_URI))
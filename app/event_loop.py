@@ -0,0 +1,71 @@
+import os
+import asyncio
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+_loop = None
+_loop_pid = None
+_lock = threading.Lock()
+
+
+def set_loop(loop: asyncio.AbstractEventLoop):
+    """
+    Adopt an already running loop as the shared loop.
+    The ASGI entry point calls this at startup so Flask async views and native
+    ASGI routes share the server's loop (and the async clients bound to it).
+    """
+    global _loop, _loop_pid
+    with _lock:
+        _loop, _loop_pid = loop, os.getpid()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Shared event loop for this process, started in a daemon thread on first use.
+    A forked worker gets its own loop.
+    """
+    global _loop, _loop_pid
+    if _loop is None or _loop_pid != os.getpid() or _loop.is_closed():
+        with _lock:
+            if _loop is None or _loop_pid != os.getpid() or _loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="shared-event-loop", daemon=True).start()
+                _loop, _loop_pid = loop, os.getpid()
+                logger.info("Started shared event loop")
+    return _loop
+
+
+def run_coroutine(coro):
+    """
+    Run a coroutine on the shared loop from synchronous code and wait for its result.
+    Context variables (Flask's request and app context) are carried over to the task.
+    """
+    loop = get_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        raise RuntimeError("run_coroutine() cannot block the shared event loop it runs on")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def iterate(async_iterable):
+    """
+    Synchronous generator over an async iterator that runs on the shared loop.
+    Lets a WSGI Response stream from async SSE generators.
+    """
+    iterator = async_iterable.__aiter__()
+    try:
+        while True:
+            try:
+                item = run_coroutine(iterator.__anext__())
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            run_coroutine(aclose())
@@ -0,0 +1,104 @@
+"""
+Persistent vector index over the markdown files in data/ (Characters.md,
+Activities.md) used by getCharacterInspiration.
+
+The index is built once and persisted to INSPIRATION_INDEX_DIR, where every
+worker loads it from. Before a query the source files' mtimes and sizes are
+checked; only when one changed is the index reloaded and refreshed, which
+re-embeds just the documents whose content hash differs. Rebuilds and
+refreshes hold a file lock so concurrent workers do not embed the same
+documents twice.
+"""
+import os
+import fcntl
+import logging
+import threading
+from contextlib import contextmanager
+
+# Constants
+data_path = os.path.abspath(os.path.join(os.getcwd(), "data"))
+INSPIRATION_INDEX_DIR = os.getenv("INSPIRATION_INDEX_DIR", os.path.join(data_path, "inspiration_index"))
+REQUIRED_EXTS = [".md"]
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_index = None
+_fingerprint = None
+_pid = None
+
+
+def source_fingerprint() -> tuple:
+    """(path, mtime, size) of every source document; cheap enough to check before each query."""
+    entries = []
+    for root, _, files in os.walk(data_path):
+        for name in files:
+            if os.path.splitext(name)[1] in REQUIRED_EXTS:
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                entries.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(entries))
+
+
+@contextmanager
+def _index_file_lock():
+    """Exclusive lock across worker processes while the persisted index is written."""
+    os.makedirs(INSPIRATION_INDEX_DIR, exist_ok=True)
+    with open(os.path.join(INSPIRATION_INDEX_DIR, ".lock"), "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _load_documents():
+    # llama_index is slow to import; keep it off the startup path
+    from llama_index.core import SimpleDirectoryReader
+
+    # Filenames as ids keep document ids stable, which refresh_ref_docs relies on
+    reader = SimpleDirectoryReader(input_dir=data_path, required_exts=REQUIRED_EXTS, recursive=True,
+                                   filename_as_id=True)
+    return reader.load_data()
+
+
+def _load_or_build():
+    """Load the persisted index, bring it up to date with the source files, and persist any change."""
+    from llama_index.core import StorageContext, VectorStoreIndex, load_index_from_storage
+
+    documents = _load_documents()
+    with _index_file_lock():
+        if os.path.exists(os.path.join(INSPIRATION_INDEX_DIR, "docstore.json")):
+            index = load_index_from_storage(StorageContext.from_defaults(persist_dir=INSPIRATION_INDEX_DIR))
+            refreshed = index.refresh_ref_docs(documents)
+
+            current_ids = {document.doc_id for document in documents}
+            removed = [doc_id for doc_id in index.ref_doc_info if doc_id not in current_ids]
+            for doc_id in removed:
+                index.delete_ref_doc(doc_id, delete_from_docstore=True)
+
+            if any(refreshed) or removed:
+                index.storage_context.persist(persist_dir=INSPIRATION_INDEX_DIR)
+                logger.info(f"Refreshed {sum(refreshed)} and removed {len(removed)} documents in {INSPIRATION_INDEX_DIR}")
+        else:
+            index = VectorStoreIndex.from_documents(documents)
+            index.storage_context.persist(persist_dir=INSPIRATION_INDEX_DIR)
+            logger.info(f"Built inspiration index over {len(documents)} documents in {INSPIRATION_INDEX_DIR}")
+    return index
+
+
+def get_index():
+    """The up-to-date index for this process; only touches llama_index storage when a source file changed."""
+    global _index, _fingerprint, _pid
+    fingerprint = source_fingerprint()
+    if _index is None or _fingerprint != fingerprint or _pid != os.getpid():
+        with _lock:
+            if _index is None or _fingerprint != fingerprint or _pid != os.getpid():
+                _index = _load_or_build()
+                _fingerprint, _pid = fingerprint, os.getpid()
+    return _index
+
+
+def query(text: str):
+    """Query the inspiration index; returns the llama_index response."""
+    return get_index().as_query_engine().query(text)
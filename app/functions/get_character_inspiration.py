@@ -1,9 +1,9 @@
 import os
 import json  # Add this line
 
-from llama_index.core import VectorStoreIndex, SimpleDirectoryReader
+from app.functions import character_index
+from app.functions.character_index import data_path
 
-data_path = os.path.abspath(os.path.join(os.getcwd(),"data"))
 print(data_path)
 
 def get_character_inspiration(inspiration):
@@ -14,19 +14,10 @@ def get_character_inspiration(inspiration):
         print(inspiration)
         try:
             if os.path.exists(data_path):
-                required_exts = [".md"]
-                reader = SimpleDirectoryReader(
-                    input_dir=data_path, 
-                    required_exts=required_exts, 
-                    recursive=True
-                )
-                documents = reader.load_data()
-                index = VectorStoreIndex.from_documents(documents)
-
-                queryEngine = index.as_query_engine()
                 print(inspiration['inspiration'])
 
-                response = queryEngine.query(inspiration['query_str'])
+                # Persisted index, refreshed only when a source document changed
+                response = character_index.query(inspiration['query_str'])
                 print("This is the response",response)
 
                 # Convert response to a JSON-serializable data structure
@@ -1,7 +1,7 @@
 import os
-from llama_index.core import VectorStoreIndex, SimpleDirectoryReader
 
-data_path = os.path.abspath(os.path.join(os.getcwd(), "data"))
+from app.functions import character_index
+from app.functions.character_index import data_path
 
 def get_character_inspiration(toolCallId,inspiration):
     fallbackResponse = {
@@ -16,19 +16,8 @@ def get_character_inspiration(toolCallId,inspiration):
     if inspiration:
         try:
             if os.path.exists(data_path):
-                required_exts = [".md"]
-                reader = SimpleDirectoryReader(
-                    input_dir=data_path, 
-                    required_exts=required_exts, 
-                    recursive=True
-                )
-                documents = reader.load_data()
-                index = VectorStoreIndex.from_documents(documents)
-
-                queryEngine = index.as_query_engine()
-
-                # Query the engine with the provided inspiration
-                response = queryEngine.query(inspiration)
+                # Persisted index, refreshed only when a source document changed
+                response = character_index.query(inspiration)
 
                 # Wrap the result in the specified format
                 return {
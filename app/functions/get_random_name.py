@@ -1,5 +1,7 @@
 import random
+import asyncio
 import requests
+from app import clients
 
 nats = [
     "AU",
@@ -30,7 +32,7 @@ async def get_random_name(params: NameParams):
     query_string = "&".join([f"{key}={value}" for key, value in query_params.items()])
 
     try:
-        response = requests.get(f"https://randomuser.me/api/?{query_string}")
+        response = await asyncio.to_thread(clients.get_http_session().get, f"https://randomuser.me/api/?{query_string}")
         response.raise_for_status()
         data = response.json()
         name = data["results"][0]["name"]
@@ -1,14 +1,15 @@
-import requests
 from pydantic import BaseModel, Field, ValidationError
-from typing import List, Optional
-import instructor
+from typing import Awaitable, Callable, List, Optional, Tuple
 from datetime import datetime
 import os
 from dotenv import load_dotenv
-from groq import Groq
-import instructor 
+import time
+import random
 import asyncio
-from openai import OpenAI
+import logging
+from app import clients
+from app.rate_limiter import TokenBucket
+from app.functions.schedule_planner import plan_schedule
 
 load_dotenv()
 
@@ -40,18 +41,91 @@ class Schedule(BaseModel):
     schedule_name: str = Field(..., description="Name of the schedule")
     lists: List[TaskList] = Field(default_factory=list, description="Task lists within the schedule")
 
-# OpenAI Client Setup
-client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
-client = instructor.from_openai(client)
+# OpenAI (Instructor) and HTTP clients come from the shared registry (app/clients.py)
 
 # API Functions
 API_TOKEN = os.environ.get("CLICKUP_API_KEY")
 BASE_URL = "https://api.clickup.com/api/v2"
+CLICKUP_RATE_LIMIT = int(os.getenv("CLICKUP_RATE_LIMIT", 100))  # requests per minute per token (ClickUp plan limit)
+CLICKUP_BURST = int(os.getenv("CLICKUP_BURST", CLICKUP_RATE_LIMIT))  # requests allowed back to back
+CLICKUP_CONCURRENCY = int(os.getenv("CLICKUP_CONCURRENCY", 10))  # requests in flight at once
+CLICKUP_MAX_RETRIES = int(os.getenv("CLICKUP_MAX_RETRIES", 5))
+CLICKUP_BACKOFF = float(os.getenv("CLICKUP_BACKOFF", 1.0))  # seconds, doubled per retry
+# Opt-in: lists are built while the LLM streams, so dependencies are only checked after some lists exist
+SCHEDULE_STREAMING = os.getenv("SCHEDULE_STREAMING", "false").lower() == "true"
+
+_limiter = None
+_limiter_pid = None
+
+
+def _get_limiter():
+    """(token bucket, concurrency semaphore) shared by every ClickUp call in this process."""
+    global _limiter, _limiter_pid
+    if _limiter is None or _limiter_pid != os.getpid():
+        _limiter = (TokenBucket(CLICKUP_RATE_LIMIT / 60, CLICKUP_BURST), asyncio.Semaphore(CLICKUP_CONCURRENCY))
+        _limiter_pid = os.getpid()
+    return _limiter
+
+
+def _retry_delay(response, attempt: int) -> Tuple[float, bool]:
+    """
+    (seconds to wait, whether the quota is full again by then) after a 429, a 5xx or a failed
+    connection (response None): until ClickUp's X-RateLimit-Reset if it sent one, else
+    exponential backoff with jitter.
+    """
+    reset = response.headers.get("X-RateLimit-Reset") if response is not None else None
+    if reset:
+        try:
+            return max(0.0, float(reset) - time.time()), True
+        except ValueError:
+            pass
+    return CLICKUP_BACKOFF * 2 ** attempt * (1 + random.random()), False
+
+
+async def clickup_request(method: str, url: str, json=None):
+    """
+    ClickUp API call through the pooled async client, rate limited by the token bucket.
+    429s and connections that could not be made are retried with backoff for every
+    method, since ClickUp did not act on them. 5xx responses and other transport
+    errors are retried for GETs only: a POST that failed that way may still have
+    created its object, and retrying it could create a duplicate.
+    The last response is returned either way.
+    """
+    import httpx
+
+    bucket, semaphore = _get_limiter()
+    # httpx sets the JSON content type itself
+    headers = {"Authorization": API_TOKEN} if API_TOKEN else {}
+    idempotent = method.upper() == "GET"
+    retry_errors = (httpx.TransportError,) if idempotent else (httpx.ConnectError, httpx.ConnectTimeout)
+
+    for attempt in range(CLICKUP_MAX_RETRIES + 1):
+        await bucket.acquire()
+        try:
+            async with semaphore:
+                response = await clients.get_async_http().request(method, url, json=json, headers=headers)
+        except retry_errors as e:
+            if attempt == CLICKUP_MAX_RETRIES:
+                raise
+            delay, _ = _retry_delay(None, attempt)
+            logging.warning(f"ClickUp {method} {url} failed ({e!r}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            continue
+        retryable = response.status_code == 429 or (idempotent and response.status_code >= 500)
+        if attempt == CLICKUP_MAX_RETRIES or not retryable:
+            return response
+
+        delay, reset = _retry_delay(response, attempt)
+        if response.status_code == 429:
+            # Everyone else would hit the same limit; hold the whole bucket
+            bucket.pause(delay, refill=reset)
+        logging.warning(f"ClickUp {method} {url} returned {response.status_code}, retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+    return response
 
 async def get_folders(space_id):
     url = f"{BASE_URL}/space/{space_id}/folder"
-    headers = {"Authorization": API_TOKEN}
-    response = requests.get(url, headers=headers)
+    response = await clickup_request("GET", url)
     if response.status_code == 200:
         return response.json()
     else:
@@ -60,8 +134,7 @@ async def get_folders(space_id):
 async def create_folder(space_id, folder_name):
     url = f"{BASE_URL}/space/{space_id}/folder"
     payload = {"name": folder_name}
-    headers = {"Authorization": API_TOKEN, "Content-Type": "application/json"}
-    response = requests.post(url, json=payload, headers=headers)
+    response = await clickup_request("POST", url, json=payload)
     if response.status_code == 200:
         return response.json().get("id")
     else:
@@ -70,8 +143,7 @@ async def create_folder(space_id, folder_name):
 async def create_list(folder_id, list_name):
     url = f"{BASE_URL}/folder/{folder_id}/list"
     payload = {"name": list_name}
-    headers = {"Authorization": API_TOKEN, "Content-Type": "application/json"}
-    response = requests.post(url, json=payload, headers=headers)
+    response = await clickup_request("POST", url, json=payload)
     if response.status_code == 200:
         return response.json().get("id")
     else:
@@ -91,8 +163,7 @@ def transform_llm_output(llm_output):
 async def set_dependency(task_id: str, depends_on_id: str):
     url = f"{BASE_URL}/task/{task_id}/dependency"
     payload = {"depends_on": depends_on_id}
-    headers = {"Authorization": API_TOKEN, "Content-Type": "application/json"}
-    response = requests.post(url, json=payload, headers=headers)
+    response = await clickup_request("POST", url, json=payload)
     if response.status_code != 200:
         raise Exception(f"Error setting dependency: {response.status_code} - {response.text}")
 
@@ -122,65 +193,192 @@ async def create_task(
     }
     payload = {k: v for k, v in payload.items() if v is not None}
 
-    headers = {"Authorization": API_TOKEN, "Content-Type": "application/json"}
-    response = requests.post(url, json=payload, headers=headers)
+    response = await clickup_request("POST", url, json=payload)
     if response.status_code == 200:
         return response.json().get("id")
     else:
         raise Exception(f"Error creating task '{name}': {response.status_code} - {response.text}")
 
-async def process_schedule(space_id: str, schedule: Schedule):
+def _item_ref(key) -> str:
+    """"list/task" or "list/task/subtask" for an item key (app/functions/schedule_planner.py)."""
+    return "/".join(str(part) for part in key if part is not None)
+
+
+class ScheduleBuilder:
+    """
+    Creates one schedule in ClickUp piece by piece: start() the folder, add_list()
+    each TaskList (possibly while later lists are still being generated), then
+    set_dependencies() once every task and subtask has an id.
+    Calls within each step run concurrently, limited by clickup_request().
+    progress, if given, is called with created= counts of tasks and subtasks as they are created.
+
+    Every folder, list, task and dependency created is recorded in clickup_ids
+    ("folder", "list/0", "task/0/1", "task/0/1/0" -> id, "dependency/0/1>0/0" -> None) and
+    reported as progress(clickup_ids=...); checkpoint, if given, is awaited after
+    each one so the record is stored before going on. A builder given the
+    clickup_ids of an earlier, interrupted run of the same schedule reuses what
+    that run created instead of creating it again.
+    """
+
+    def __init__(self, space_id: str, progress: Optional[Callable[..., None]] = None,
+                 clickup_ids: Optional[dict] = None, checkpoint: Optional[Callable[[], Awaitable[None]]] = None):
+        self.space_id = space_id
+        self.progress = progress
+        self.checkpoint = checkpoint
+        self.clickup_ids = clickup_ids if clickup_ids is not None else {}
+        self.ids = {}  # item key (app/functions/schedule_planner.py) -> ClickUp task id
+        self.created = 0
+        self._folder = None
+
+    @property
+    def started(self) -> bool:
+        return self._folder is not None
+
+    def start(self, schedule_name: str):
+        """Begin creating the folder; lists added meanwhile wait for it."""
+        self._folder = asyncio.ensure_future(self._once("folder", lambda: create_folder(self.space_id, schedule_name)))
+
+    async def folder_id(self) -> str:
+        return await self._folder
+
+    async def cancel(self, jobs=()):
+        """Cancel and collect the folder call and the given list jobs, so none is left running or with an unretrieved error."""
+        pending = list(jobs) + ([self._folder] if self._folder is not None else [])
+        for job in pending:
+            job.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _once(self, ref: str, create: Callable[[], Awaitable]):
+        """The id recorded under ref, or the result of create(), recorded before it is returned."""
+        if ref in self.clickup_ids:
+            return self.clickup_ids[ref]
+        result = await create()
+        self.clickup_ids[ref] = result
+        if self.progress:
+            self.progress(clickup_ids=self.clickup_ids)
+        if self.checkpoint:
+            await self.checkpoint()
+        return result
+
+    async def _create(self, key, list_id, item, parent_id=None):
+        item_id = await self._once(f"task/{_item_ref(key)}", lambda: create_task(
+            list_id=list_id,
+            name=item.name,
+            description=item.description,
+            start_date=item.start_date,
+            due_date=item.due_date,
+            priority=item.priority,
+            link=item.link,
+            parent_id=parent_id
+        ))
+        self.ids[key] = item_id
+        self.created += 1
+        if self.progress:
+            self.progress(created=self.created)
+        return item_id
+
+    async def _create_task_tree(self, list_index, task_index, list_id, task: Task):
+        # A subtask needs its parent's id, so subtasks start once their task exists
+        task_id = await self._create((list_index, task_index, None), list_id, task)
+        await asyncio.gather(*(self._create((list_index, task_index, subtask_index), list_id, sub, parent_id=task_id)
+                               for subtask_index, sub in enumerate(task.subtasks)))
+
+    async def add_list(self, list_index: int, task_list: TaskList):
+        """Create the schedule's list_index-th task list in its folder, with all its tasks and subtasks."""
+        folder_id = await self.folder_id()
+        list_id = await self._once(f"list/{list_index}", lambda: create_list(folder_id, task_list.list_name))
+        await asyncio.gather(*(self._create_task_tree(list_index, task_index, list_id, task)
+                               for task_index, task in enumerate(task_list.tasks)))
+
+    async def set_dependencies(self, plan):
+        """One topological level at a time, with each level's calls in parallel."""
+        if self.progress:
+            self.progress(stage="dependencies")
+        for edges in plan.edges_by_level():
+            await asyncio.gather(*(
+                self._once(f"dependency/{_item_ref(key)}>{_item_ref(dep)}",
+                           lambda key=key, dep=dep: set_dependency(self.ids[key], self.ids[dep]))
+                for key, dep in edges))
+
+
+async def process_schedule(space_id: str, schedule: Schedule, progress: Optional[Callable[..., None]] = None,
+                           clickup_ids: Optional[dict] = None,
+                           checkpoint: Optional[Callable[[], Awaitable[None]]] = None):
     """
     Process a ClickUp schedule under a single folder.
+    Creation is ordered folder -> lists -> tasks -> subtasks -> dependencies (see ScheduleBuilder).
+    The dependency graph is checked first (app/functions/schedule_planner.py), so a
+    schedule with unknown names or cycles fails before any ClickUp call.
+    progress, if given, is called with created=/total= counts of tasks and subtasks as they are created.
+    clickup_ids and checkpoint are passed to ScheduleBuilder, to resume an interrupted run.
     """
+    plan = plan_schedule(schedule)
+
+    total = sum(1 + len(task.subtasks) for task_list in schedule.lists for task in task_list.tasks)
+    if progress:
+        progress(stage="creating", created=0, total=total)
+
     # Create the main folder once for the entire schedule
-    folder_id = await create_folder(space_id, schedule.schedule_name)
-    name_to_id_map = {}
-
-    # Iterate over task lists and create tasks within a single folder
-    for task_list in schedule.lists:
-        list_id = await create_list(folder_id, task_list.list_name)
-
-        # Create tasks and their subtasks within the same list
-        for task in task_list.tasks:
-            task_id = await create_task(
-                list_id=list_id,
-                name=task.name,
-                description=task.description,
-                start_date=task.start_date,
-                due_date=task.due_date,
-                priority=task.priority,
-                link=task.link
-            )
-            name_to_id_map[task.name] = task_id
-
-            # Ensure subtasks are created directly under the same list
-            for sub in task.subtasks:
-                sub_id = await create_task(
-                    list_id=list_id,
-                    name=sub.name,
-                    description=sub.description,
-                    start_date=sub.start_date,
-                    due_date=sub.due_date,
-                    priority=sub.priority,
-                    link=sub.link,
-                    parent_id=task_id  # Fixed to ensure proper parent-child relation
-                )
-                name_to_id_map[sub.name] = sub_id
-
-    # Second pass: Set dependencies between tasks and subtasks within the same list
-    for task_list in schedule.lists:
-        for task in task_list.tasks:
-            if task.depends_on:
-                for dep_name in task.depends_on:
-                    if dep_name in name_to_id_map:
-                        await set_dependency(name_to_id_map[task.name], name_to_id_map[dep_name])
-            # Handle subtask dependencies
-            for sub in task.subtasks:
-                if sub.depends_on:
-                    for dep_name in sub.depends_on:
-                        if dep_name in name_to_id_map:
-                            await set_dependency(name_to_id_map[sub.name], name_to_id_map[dep_name])
+    builder = ScheduleBuilder(space_id, progress, clickup_ids, checkpoint)
+    builder.start(schedule.schedule_name)
+    await builder.folder_id()
+    await asyncio.gather(*(builder.add_list(index, task_list) for index, task_list in enumerate(schedule.lists)))
+
+    # Second pass: Set dependencies once every task and subtask has an id
+    await builder.set_dependencies(plan)
+
+
+async def stream_and_process_schedule(space_id: str, prompt: str,
+                                      progress: Optional[Callable[..., None]] = None,
+                                      checkpoint: Optional[Callable[[], Awaitable[None]]] = None) -> Schedule:
+    """
+    Generate a schedule with a streamed structured output and build it in ClickUp as it arrives.
+    A TaskList is complete once the model starts the next one, so it is created
+    while the rest of the schedule is still being generated. Dependencies can
+    only be checked against the whole schedule, so they are planned when the
+    stream ends, before the remaining lists are created; a schedule with bad
+    dependencies fails then, with the lists already streamed left in ClickUp.
+    This trade-off is why SCHEDULE_STREAMING is opt-in.
+    Once the stream ends the whole schedule is reported as progress(schedule=...)
+    and checkpointed, so an interrupted run can be resumed with process_schedule().
+    """
+    if progress:
+        progress(stage="generating", created=0)
+
+    builder = ScheduleBuilder(space_id, progress, checkpoint=checkpoint)
+    list_jobs = []
+    completed = 0
+    partial = None
+    try:
+        async for partial in stream_schedule(prompt):
+            lists = partial.lists or []
+            # The name comes before the lists, so it is final once lists begin
+            if not builder.started and partial.lists is not None and partial.schedule_name:
+                builder.start(partial.schedule_name)
+            while builder.started and completed < len(lists) - 1:
+                task_list = TaskList.model_validate(lists[completed].model_dump())
+                list_jobs.append(asyncio.ensure_future(builder.add_list(completed, task_list)))
+                completed += 1
+
+        schedule = transform_llm_output(partial.model_dump() if partial is not None else {})
+        plan = plan_schedule(schedule)
+        if progress:
+            progress(stage="creating", schedule_name=schedule.schedule_name, schedule=schedule.model_dump(),
+                     total=sum(1 + len(task.subtasks) for task_list in schedule.lists for task in task_list.tasks))
+        if checkpoint:
+            await checkpoint()
+        if not builder.started:
+            builder.start(schedule.schedule_name)
+        list_jobs.extend(asyncio.ensure_future(builder.add_list(index, schedule.lists[index]))
+                         for index in range(completed, len(schedule.lists)))
+        await builder.folder_id()
+        await asyncio.gather(*list_jobs)
+    except BaseException:
+        await builder.cancel(list_jobs)
+        raise
+
+    await builder.set_dependencies(plan)
+    return schedule
 
 
 # Generate Schedule with Instructor Ollama
@@ -239,8 +437,8 @@ async def process_schedule(space_id: str, schedule: Schedule):
 #     )
 #     return response
 
-async def generate_schedule(prompt: str) -> Schedule:
-    template = f"""
+def schedule_prompt(prompt: str) -> str:
+    return f"""
     I'm providing you with an extended Python class definition for a Schedule object. 
     Your task is to generate a JSON string that accurately represents a valid instance of this extended Schedule object, 
     which includes optional fields: 'priority', 'link', and 'depends_on'.
@@ -307,10 +505,25 @@ async def generate_schedule(prompt: str) -> Schedule:
         lists: List[TaskList] = Field(default_factory=list, description="Task lists within the schedule")
     """
 
-    response = client.chat.completions.create(
+
+async def generate_schedule(prompt: str) -> Schedule:
+    template = schedule_prompt(prompt)
+
+    response = await asyncio.to_thread(
+        clients.get_instructor().chat.completions.create,
         model= "gpt-4o", #"llama3-groq-70b-8192-tool-use-preview",
         messages=[{"role": "user", "content": template}],
         response_model=Schedule
     )
     print(response)
     return response
+
+
+async def stream_schedule(prompt: str):
+    """Partial Schedule objects from gpt-4o, each one a more complete prefix of the final schedule."""
+    async for partial in clients.get_async_instructor().chat.completions.create_partial(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": schedule_prompt(prompt)}],
+        response_model=Schedule
+    ):
+        yield partial
@@ -0,0 +1,129 @@
+"""
+Dependency planning for a validated Schedule, before any ClickUp call is made.
+
+Tasks and subtasks refer to each other by name in depends_on. plan_schedule()
+resolves those names into a DAG and rejects schedules ClickUp could only be
+partly built from: references to names that do not exist or that more than
+one task or subtask shares, self-dependencies and cycles. Names only have to
+be unique where a dependency points at them. For a valid schedule it returns
+the topological levels of the DAG, so dependencies can be set level by level,
+each level in parallel.
+
+Items are identified by their position, (list index, task index, subtask index
+or None for the task itself), so repeated names elsewhere do not collide.
+"""
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from app.functions.schedule_clickup import Schedule
+
+ItemKey = Tuple[int, int, Optional[int]]
+
+
+class SchedulePlanError(ValueError):
+    """The schedule's dependencies cannot be materialized; problems lists every reason."""
+
+    def __init__(self, problems: List[str]):
+        self.problems = problems
+        super().__init__("Invalid schedule: " + "; ".join(problems))
+
+
+class SchedulePlan:
+    """
+    names: item key -> task or subtask name, for every item in schedule order.
+    dependencies: item key -> keys of the items it depends on.
+    levels: item keys grouped so that everything an item depends on is in an earlier level.
+    """
+
+    def __init__(self, names: Dict[ItemKey, str], dependencies: Dict[ItemKey, List[ItemKey]],
+                 levels: List[List[ItemKey]]):
+        self.names = names
+        self.dependencies = dependencies
+        self.levels = levels
+
+    def edges_by_level(self) -> List[List[Tuple[ItemKey, ItemKey]]]:
+        """(item, depends on) key pairs grouped by the level of item; levels without edges are left out."""
+        grouped = []
+        for level in self.levels:
+            edges = [(key, dep) for key in level for dep in self.dependencies[key]]
+            if edges:
+                grouped.append(edges)
+        return grouped
+
+
+def schedule_items(schedule: "Schedule") -> Iterator[Tuple[ItemKey, object]]:
+    """(key, task or subtask) for every item, tasks before their subtasks."""
+    for list_index, task_list in enumerate(schedule.lists):
+        for task_index, task in enumerate(task_list.tasks):
+            yield (list_index, task_index, None), task
+            for subtask_index, sub in enumerate(task.subtasks):
+                yield (list_index, task_index, subtask_index), sub
+
+
+def _find_cycle(dependencies: Dict[ItemKey, List[ItemKey]], remaining: set) -> List[ItemKey]:
+    """One cycle among the items Kahn's algorithm could not order, as [a, b, ..., a]."""
+    start = next(key for key in dependencies if key in remaining)
+    path, position = [], {}
+    key = start
+    # Every remaining item still has an unresolved dependency among the remaining ones, so this walk must loop
+    while key not in position:
+        position[key] = len(path)
+        path.append(key)
+        key = next(dep for dep in dependencies[key] if dep in remaining)
+    return path[position[key]:] + [key]
+
+
+def plan_schedule(schedule: "Schedule") -> SchedulePlan:
+    """Build and check the dependency DAG of a schedule; raises SchedulePlanError listing every problem."""
+    problems = []
+    names: Dict[ItemKey, str] = {}
+    keys_by_name: Dict[str, List[ItemKey]] = {}
+    depends_on: Dict[ItemKey, List[str]] = {}
+
+    for key, item in schedule_items(schedule):
+        names[key] = item.name
+        keys_by_name.setdefault(item.name, []).append(key)
+        # Repeated names in depends_on would only repeat the same ClickUp call
+        depends_on[key] = list(dict.fromkeys(item.depends_on or []))
+
+    dependencies: Dict[ItemKey, List[ItemKey]] = {}
+    for key, dep_names in depends_on.items():
+        dependencies[key] = []
+        for dep_name in dep_names:
+            targets = keys_by_name.get(dep_name, [])
+            if not targets:
+                problems.append(f"'{names[key]}' depends on unknown task '{dep_name}'")
+            elif len(targets) > 1:
+                problems.append(f"'{names[key]}' depends on '{dep_name}', which names more than one task or subtask")
+            elif targets[0] == key:
+                problems.append(f"'{names[key]}' depends on itself")
+            else:
+                dependencies[key].append(targets[0])
+    if problems:
+        raise SchedulePlanError(problems)
+
+    # Kahn's algorithm, one level at a time
+    waiting = {key: len(deps) for key, deps in dependencies.items()}
+    dependents: Dict[ItemKey, List[ItemKey]] = {key: [] for key in dependencies}
+    for key, deps in dependencies.items():
+        for dep in deps:
+            dependents[dep].append(key)
+
+    levels = []
+    level = [key for key, count in waiting.items() if count == 0]
+    while level:
+        levels.append(level)
+        next_level = []
+        for key in level:
+            for dependent in dependents[key]:
+                waiting[dependent] -= 1
+                if waiting[dependent] == 0:
+                    next_level.append(dependent)
+        level = next_level
+
+    remaining = {key for key, count in waiting.items() if count > 0}
+    if remaining:
+        cycle = _find_cycle(dependencies, remaining)
+        raise SchedulePlanError([f"dependency cycle: {' -> '.join(names[key] for key in cycle)}"])
+
+    return SchedulePlan(names, dependencies, levels)
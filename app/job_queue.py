@@ -0,0 +1,278 @@
+"""
+Persistent background job queue backed by SQLite.
+
+Work too slow for a voice webhook (schedule_clickup: an LLM call plus dozens
+of ClickUp API calls) is enqueued as a job and the request returns its id at
+once. Worker coroutines on the shared event loop claim queued jobs, run the
+registered handler and record progress and the outcome in the jobs table,
+where any worker process can read them for the status endpoint. Jobs survive
+a restart: queued ones are picked up again, and running ones whose worker
+stopped reporting are requeued until they run out of attempts. A requeued job
+runs its handler from the start with the progress the earlier attempt
+recorded, so a handler with side effects checkpoints what it has done and
+skips it on a rerun.
+"""
+import os
+import json
+import time
+import uuid
+import asyncio
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app import event_loop
+
+# Constants
+JOB_QUEUE_DB = os.getenv("JOB_QUEUE_DB", "data/databases/jobs.db")
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", 2))  # worker coroutines per process
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", 2.0))  # seconds; picks up jobs enqueued by other processes
+JOB_TIMEOUT = float(os.getenv("JOB_TIMEOUT", 600))  # seconds a job may run
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", 2))
+JOB_PROGRESS_INTERVAL = float(os.getenv("JOB_PROGRESS_INTERVAL", 0.5))  # seconds between progress writes
+JOB_STALE_AFTER = float(os.getenv("JOB_STALE_AFTER", 120))  # running job without a heartbeat for this long is requeued
+
+QUEUED, RUNNING, SUCCEEDED, FAILED = "queued", "running", "succeeded", "failed"
+
+logger = logging.getLogger(__name__)
+
+
+class JobContext:
+    """
+    Handed to a job handler; report() records progress, written to the table in the background.
+    progress starts as what earlier attempts of the job recorded, so a requeued job can
+    tell what they already did.
+    """
+
+    def __init__(self, job_id: str, progress: Optional[Dict[str, Any]] = None,
+                 save: Optional[Callable[[str], Awaitable[None]]] = None):
+        self.job_id = job_id
+        self.progress: Dict[str, Any] = progress or {}
+        self.dirty = False
+        self._save = save
+        self._last_save = None
+
+    def report(self, **progress):
+        self.progress.update(progress)
+        self.dirty = True
+
+    async def checkpoint(self):
+        """Write the progress now, e.g. before a step a rerun of the job must not repeat."""
+        if self._save is None:
+            return
+        self.dirty = False
+        self._last_save = save = asyncio.ensure_future(self._save_after(self._last_save, json.dumps(self.progress)))
+        # Shielded, so a cancelled caller (the heartbeat at the end of a job) does not leave a write half-ordered
+        await asyncio.shield(save)
+
+    async def _save_after(self, previous: Optional[asyncio.Future], progress: str):
+        # Writes go out in order, so an older snapshot never overwrites a newer one
+        if previous is not None:
+            await asyncio.gather(previous, return_exceptions=True)
+        await self._save(progress)
+
+    async def flush(self):
+        """Wait for progress writes still in flight."""
+        if self._last_save is not None:
+            await asyncio.gather(self._last_save, return_exceptions=True)
+
+
+class JobQueue:
+    """
+    register() job handlers by kind, enqueue() jobs, get() their status.
+    Handlers are coroutine functions taking (payload, context) and returning a JSON-serialisable result.
+    """
+
+    def __init__(self, db_path: str = JOB_QUEUE_DB, workers: int = JOB_WORKERS,
+                 poll_interval: float = JOB_POLL_INTERVAL, timeout: float = JOB_TIMEOUT,
+                 max_attempts: int = JOB_MAX_ATTEMPTS):
+        self.db_path = db_path
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.handlers: Dict[str, Callable] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._pid = None
+        self._wakeup = None
+        self._schema_ready = False
+
+    def _connection(self) -> sqlite3.Connection:
+        # One autocommit connection per thread, reused across calls
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            if not self._schema_ready:
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.row_factory = sqlite3.Row
+            if not self._schema_ready:
+                # Created on first use (normally the workers' first claim at startup), so constructing does no I/O
+                self._create_schema(conn)
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def _create_schema(self, conn: sqlite3.Connection):
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, kind TEXT NOT NULL, payload TEXT NOT NULL, status TEXT NOT NULL, "
+            "progress TEXT, result TEXT, error TEXT, attempts INTEGER NOT NULL DEFAULT 0, "
+            "created_at REAL NOT NULL, updated_at REAL NOT NULL)")
+        conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+        self._schema_ready = True
+
+    def register(self, kind: str):
+        """Decorator registering the coroutine function that runs jobs of this kind."""
+        def decorator(func):
+            self.handlers[kind] = func
+            return func
+        return decorator
+
+    def enqueue(self, kind: str, payload: dict) -> str:
+        """Store a new job and wake a worker; returns the job id."""
+        if kind not in self.handlers:
+            raise KeyError(f"No job handler registered for {kind!r}")
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        self._connection().execute(
+            "INSERT INTO jobs (id, kind, payload, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (job_id, kind, json.dumps(payload), QUEUED, now, now))
+        self.start()
+        event_loop.get_loop().call_soon_threadsafe(self._wakeup.set)
+        return job_id
+
+    async def aenqueue(self, kind: str, payload: dict) -> str:
+        """enqueue() for the event loop; the insert runs in a worker thread."""
+        return await asyncio.to_thread(self.enqueue, kind, payload)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """Status, progress and outcome of a job, or None if there is no such job."""
+        row = self._connection().execute(
+            "SELECT id, kind, status, progress, result, error, attempts, created_at, updated_at FROM jobs WHERE id = ?",
+            (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["progress"] = json.loads(job["progress"]) if job["progress"] else {}
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def start(self):
+        """Start this process's worker coroutines on the shared event loop, once per process."""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            loop = event_loop.get_loop()
+            self._wakeup = asyncio.Event()
+            for number in range(self.workers):
+                asyncio.run_coroutine_threadsafe(self._worker(number), loop)
+            self._pid = os.getpid()
+
+    def _claim(self) -> Optional[sqlite3.Row]:
+        """Atomically move the oldest queued job to running; BEGIN IMMEDIATE keeps two processes from taking the same one."""
+        conn = self._connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Jobs whose worker died mid-run go back to the queue while they have attempts left
+            conn.execute(
+                "UPDATE jobs SET status = CASE WHEN attempts < ? THEN ? ELSE ? END, "
+                "error = CASE WHEN attempts < ? THEN error ELSE 'worker stopped' END, updated_at = ? "
+                "WHERE status = ? AND updated_at < ?",
+                (self.max_attempts, QUEUED, FAILED, self.max_attempts, now, RUNNING, now - JOB_STALE_AFTER))
+            row = conn.execute(
+                "SELECT id, kind, payload, progress FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1",
+                (QUEUED,)).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                    (RUNNING, now, row["id"]))
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        return row
+
+    def _update(self, job_id: str, **fields):
+        fields["updated_at"] = time.time()
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        self._connection().execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*fields.values(), job_id))
+
+    async def _worker(self, number: int):
+        while True:
+            try:
+                row = await asyncio.to_thread(self._claim)
+            except sqlite3.Error as e:
+                logger.error(f"Job worker {number} failed to claim a job: {e}")
+                row = None
+
+            if row is None:
+                # Woken by a local enqueue, or polls for jobs from other processes
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+
+            await self._run(row)
+
+    async def _run(self, row: sqlite3.Row):
+        job_id, kind = row["id"], row["kind"]
+        context = JobContext(job_id, json.loads(row["progress"]) if row["progress"] else {},
+                             save=lambda progress: asyncio.to_thread(self._update, job_id, progress=progress))
+        heartbeat = asyncio.create_task(self._heartbeat(context))
+        start = time.perf_counter()
+        try:
+            handler = self.handlers[kind]
+            result = await asyncio.wait_for(handler(json.loads(row["payload"]), context), self.timeout)
+            fields = {"status": SUCCEEDED, "result": json.dumps(result)}
+            logger.info(f"Job {job_id} ({kind}) succeeded in {time.perf_counter() - start:.1f}s")
+        except asyncio.TimeoutError:
+            fields = {"status": FAILED, "error": f"Timed out after {self.timeout}s"}
+            logger.error(f"Job {job_id} ({kind}) timed out after {self.timeout}s")
+        except Exception as e:
+            fields = {"status": FAILED, "error": str(e)}
+            logger.error(f"Job {job_id} ({kind}) failed: {e}")
+        finally:
+            heartbeat.cancel()
+
+        fields["progress"] = json.dumps(context.progress)
+        try:
+            await context.flush()
+            await asyncio.to_thread(self._update, job_id, **fields)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to record outcome of job {job_id}: {e}")
+
+    async def _heartbeat(self, context: JobContext):
+        """Write reported progress every JOB_PROGRESS_INTERVAL; the updated_at it bumps marks the job as alive."""
+        last_write = time.monotonic()
+        while True:
+            await asyncio.sleep(JOB_PROGRESS_INTERVAL)
+            if context.dirty or time.monotonic() - last_write > JOB_STALE_AFTER / 4:
+                try:
+                    await context.checkpoint()
+                    last_write = time.monotonic()
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to record progress of job {context.job_id}: {e}")
+
+
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Process-wide queue over JOB_QUEUE_DB, shared by the handlers that enqueue and the status endpoint."""
+    global _job_queue
+    if _job_queue is None:
+        with _job_queue_lock:
+            if _job_queue is None:
+                _job_queue = JobQueue()
+    return _job_queue
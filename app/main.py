@@ -1,8 +1,12 @@
 import os
 import logging
-from flask import Flask, request
+import functools
+from flask import Flask, Response, request
 from flask_jwt_extended import JWTManager
 from .api import api as api_blueprint
+from .event_loop import run_coroutine
+from . import metrics, warmup
+from .job_queue import get_job_queue
 from flask_cors import CORS
 
 from dotenv import load_dotenv
@@ -10,7 +14,21 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
-app = Flask(__name__)
+
+class SharedLoopFlask(Flask):
+    """
+    Flask app whose async views all run on one shared event loop instead of a
+    fresh loop per request, so async clients and their connection pools are reused.
+    """
+
+    def async_to_sync(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return run_coroutine(func(*args, **kwargs))
+        return wrapper
+
+
+app = SharedLoopFlask(__name__)
 app.config["JWT_SECRET_KEY"] =  os.getenv('FLASK_JWT_SECRET_KEY') # Update with your actual secret key
 CORS(app)
 jwt = JWTManager(app)  # Initialize JWT with the Flask app
@@ -27,6 +45,29 @@ def index():
     return {"hi": "Hello, World!"}
 
 
+def start_background_work():
+    """
+    Start warm-up and the background job workers in this process; no-op once started.
+    Called when a server creates the app (app/wsgi.py, ASGI lifespan startup, main()),
+    never from a request, so /ready turns 200 without waiting for traffic.
+    """
+    warmup.start()
+    # Picks up jobs left queued by a previous run
+    get_job_queue().start()
+
+
+@app.get('/ready')
+def ready():
+    """Readiness probe: 200 once startup warm-up has finished, 503 until then."""
+    return warmup.status(), 200 if warmup.is_ready() else 503
+
+
+@app.get('/metrics')
+def metrics_endpoint():
+    """Stage latency histograms in Prometheus text format."""
+    return Response(metrics.render_prometheus(), content_type='text/plain; version=0.0.4')
+
+
 
 # List all registered endpoints
 def list_endpoints():
@@ -45,9 +86,14 @@ for endpoint in endpoints:
 
 
 def main():
+    # Development server. For production use the ASGI entry point:
+    #   uvicorn app.asgi:application --workers 4
     port = int(os.getenv('PORT', 8000))  # Get port from environment variable or fallback to 5000
     print(f"Port: {port}")
 
+    # The reloader's parent process only watches files; the child serves requests
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_background_work()
     app.run(port=port, debug=True)
 
 if __name__ == '__main__':
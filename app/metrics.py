@@ -0,0 +1,123 @@
+"""
+Lightweight latency instrumentation.
+
+Stages are timed with span() and recorded into a fixed-bucket histogram (exported
+in Prometheus text format on /metrics) and, when a request timer is active, into
+that request's timings (returned as a Server-Timing header or SSE trailer).
+Recording is a perf_counter() call, a bisect and a short lock, cheap enough to
+leave on in production.
+"""
+import os
+import time
+import json
+import bisect
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+# Constants
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_current_timings = contextvars.ContextVar("request_timings", default=None)
+
+
+class Histogram:
+    """Cumulative histogram per label value, in seconds."""
+
+    def __init__(self, name: str, description: str, label: str, buckets=BUCKETS):
+        self.name = name
+        self.description = description
+        self.label = label
+        self.buckets = buckets
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, label_value: str, seconds: float):
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(label_value)
+            if series is None:
+                series = self._series[label_value] = [[0] * (len(self.buckets) + 1), 0, 0.0]
+            series[0][index] += 1
+            series[1] += 1
+            series[2] += seconds
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for label_value, (counts, count, total) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    lines.append(f'{self.name}_bucket{{{self.label}="{label_value}",le="{bound}"}} {cumulative}')
+                lines.append(f'{self.name}_bucket{{{self.label}="{label_value}",le="+Inf"}} {count}')
+                lines.append(f'{self.name}_sum{{{self.label}="{label_value}"}} {total}')
+                lines.append(f'{self.name}_count{{{self.label}="{label_value}"}} {count}')
+        return "\n".join(lines)
+
+
+stage_seconds = Histogram("voice_stage_seconds", "Latency of each stage of a voice turn.", "stage")
+
+
+def record(stage: str, seconds: float):
+    """Record a stage duration globally and on the active request, if any."""
+    if not METRICS_ENABLED:
+        return
+    stage_seconds.observe(stage, seconds)
+    timings = _current_timings.get()
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + seconds
+
+
+@contextmanager
+def span(stage: str):
+    """Time the enclosed block as one stage."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - start)
+
+
+@contextmanager
+def request_timer():
+    """Collect the stages recorded while handling one request into a dict."""
+    timings = {}
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+
+def current_timings() -> Optional[Dict[str, float]]:
+    """Timings dict of the active request, for code that outlives the request context (SSE generators)."""
+    return _current_timings.get()
+
+
+def record_into(timings: Optional[Dict[str, float]], stage: str, seconds: float):
+    """Record a stage for a request whose timer is no longer the active context."""
+    if not METRICS_ENABLED:
+        return
+    stage_seconds.observe(stage, seconds)
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + seconds
+
+
+def server_timing_header(timings: Dict[str, float]) -> str:
+    """Format timings as a Server-Timing header value (milliseconds)."""
+    return ", ".join(f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in timings.items())
+
+
+def sse_trailer(timings: Dict[str, float]) -> str:
+    """
+    Timings as an SSE comment line sent after the stream. Comment lines are
+    ignored by SSE clients, so this does not disturb Vapi's parser.
+    """
+    return f": timings {json.dumps({stage: round(seconds * 1000, 1) for stage, seconds in timings.items()})}\n\n"
+
+
+def render_prometheus() -> str:
+    return stage_seconds.render() + "\n"
@@ -0,0 +1,171 @@
+"""
+Background, batched JSONL logging of raw request payloads.
+
+Request handlers only enqueue (payload type, raw body) and return; a daemon
+thread writes compact JSON lines in batches, rotates the file once it passes a
+size limit and gzips the rotated copies. High-frequency types are sampled, and
+when the queue is full an entry is dropped and counted rather than blocking
+the request.
+"""
+import os
+import gzip
+import json
+import time
+import queue
+import atexit
+import random
+import shutil
+import logging
+import threading
+from typing import Dict, Optional
+
+# Constants
+PAYLOAD_LOG_QUEUE_SIZE = int(os.getenv("PAYLOAD_LOG_QUEUE_SIZE", 1000))
+PAYLOAD_LOG_BATCH_SIZE = int(os.getenv("PAYLOAD_LOG_BATCH_SIZE", 100))
+PAYLOAD_LOG_FLUSH_INTERVAL = float(os.getenv("PAYLOAD_LOG_FLUSH_INTERVAL", 1.0))
+PAYLOAD_LOG_MAX_BYTES = int(os.getenv("PAYLOAD_LOG_MAX_BYTES", 50 * 1024 * 1024))
+PAYLOAD_LOG_BACKUPS = int(os.getenv("PAYLOAD_LOG_BACKUPS", 5))
+# "type=rate,..." share of payloads of each type that are logged; unlisted types are always logged
+PAYLOAD_LOG_SAMPLE_RATES = os.getenv("PAYLOAD_LOG_SAMPLE_RATES",
+                                     "speech-update=0.05,transcript=0.1,model-output=0.05")
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+def parse_sample_rates(spec: str) -> Dict[str, float]:
+    rates = {}
+    for item in spec.split(","):
+        if "=" in item:
+            payload_type, rate = item.split("=", 1)
+            rates[payload_type.strip()] = float(rate)
+    return rates
+
+
+class PayloadLogger:
+    """Bounded queue in front of one writer thread; safe to call from any thread or the event loop."""
+
+    def __init__(self, path: str,
+                 queue_size: int = PAYLOAD_LOG_QUEUE_SIZE,
+                 batch_size: int = PAYLOAD_LOG_BATCH_SIZE,
+                 flush_interval: float = PAYLOAD_LOG_FLUSH_INTERVAL,
+                 max_bytes: int = PAYLOAD_LOG_MAX_BYTES,
+                 backups: int = PAYLOAD_LOG_BACKUPS,
+                 sample_rates: Optional[Dict[str, float]] = None):
+        self.path = path
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.sample_rates = parse_sample_rates(PAYLOAD_LOG_SAMPLE_RATES) if sample_rates is None else sample_rates
+        self.written = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        # One writer thread per process; a forked worker starts its own
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._queue = queue.Queue(maxsize=self.queue_size)
+                    self._thread = threading.Thread(target=self._run, name="payload-logger", daemon=True)
+                    self._thread.start()
+                    self._pid = os.getpid()
+                    atexit.register(self.close)
+
+    def log(self, payload_type: Optional[str], body: bytes) -> bool:
+        """
+        Queue one raw JSON payload for writing. Never blocks.
+        Returns False if it was sampled out or dropped because the queue is full.
+        """
+        rate = self.sample_rates.get(payload_type, 1.0)
+        if rate < 1.0 and random.random() >= rate:
+            self.sampled_out += 1
+            return False
+
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((time.time(), payload_type, body))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def close(self, timeout: float = 5.0):
+        """Flush what is queued and stop the writer thread."""
+        if self._pid != os.getpid() or not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def stats(self) -> dict:
+        return {
+            "written": self.written,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+        }
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = [] if first is _STOP else [first]
+            stopping = first is _STOP
+            while not stopping and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+            if batch:
+                try:
+                    self._write(batch)
+                except Exception as e:
+                    logger.error(f"Failed to write {len(batch)} payloads to {self.path}: {e}")
+
+    def _write(self, batch):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(self.path, "ab") as log_file:
+            for timestamp, payload_type, body in batch:
+                # Bodies are already valid JSON; newlines outside strings are whitespace, so JSONL stays one line each
+                log_file.write(b'{"ts":%.3f,"type":%s,"payload":' % (timestamp, json.dumps(payload_type).encode()))
+                log_file.write(body.replace(b"\n", b" ").replace(b"\r", b" ") if body else b"null")
+                log_file.write(b"}\n")
+            size = log_file.tell()
+        self.written += len(batch)
+
+        if size >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self):
+        """Shift path.1.gz .. path.N.gz up by one and gzip the current file into path.1.gz."""
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}.gz"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}.gz")
+
+        rotated = f"{self.path}.rotating"
+        os.replace(self.path, rotated)
+        if self.backups > 0:
+            with open(rotated, "rb") as source, gzip.open(f"{self.path}.1.gz", "wb") as target:
+                shutil.copyfileobj(source, target)
+        os.remove(rotated)
@@ -1,13 +1,21 @@
 import logging
 import json
 import os
+import sys
 import time
 from datetime import datetime, date
+from pathlib import Path
+
+if not __package__:
+    # Run as a script, this directory comes first on sys.path and "app" would resolve to this
+    # file; put the repository root ahead of it so "from app import clients" finds the package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
 from db import *
 from typing import List, Union, Literal
 from pydantic import BaseModel, Field, ValidationError
 import pinecone_rag  # Import the RAG functionality
-from pinecone import Pinecone
+from app import clients
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import create_engine
 from flask_cors import CORS
@@ -96,12 +104,9 @@ class Message(BaseModel):
 class MemoryData(BaseModel):
     messages: List[Union[Message, str]]
 
-# Initialize the Pinecone client
-pc_key = os.getenv("PINECONE_API_KEY")
-
-pc = Pinecone(api_key=pc_key)
-user_index = pc.Index("user-data-openai-embedding")
-book_index = pc.Index("ah-test")
+# Pinecone indexes come from the shared client registry
+user_index = clients.get_user_index()
+book_index = clients.get_book_index()
 
 # Simulate a database with dictionaries
 user_db = {}
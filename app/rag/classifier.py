@@ -0,0 +1,184 @@
+import os
+import re
+import time
+import random
+import logging
+import threading
+from typing import Callable, Dict, List, Tuple
+
+# Constants
+CLASSIFIER_MODE = os.getenv("CLASSIFIER_MODE", "local")  # "local" (with LLM fallback) or "llm"
+CLASSIFIER_MIN_MARGIN = float(os.getenv("CLASSIFIER_MIN_MARGIN", 0.03))
+CLASSIFIER_SHADOW_RATE = float(os.getenv("CLASSIFIER_SHADOW_RATE", 0.0))  # share of confident turns checked by the LLM
+CLASSIFIER_KEYWORD_BONUS = float(os.getenv("CLASSIFIER_KEYWORD_BONUS", 0.03))  # added to ATOMIC_HABITS similarity on a keyword hit
+
+# Example queries per label; their embeddings are averaged into one centroid per label
+LABEL_EXAMPLES = {
+    "ATOMIC_HABITS": [
+        "What is the Two-Minute Rule?",
+        "How do I build good habits?",
+        "What does James Clear say about identity-based habits?",
+        "Explain habit stacking.",
+        "What are the four laws of behavior change?",
+        "How can I break a bad habit?",
+        "Why do small improvements add up over time?",
+        "How does the environment shape my behavior?",
+        "What is the plateau of latent potential?",
+        "How do I make a habit more satisfying?",
+    ],
+    "PERSONAL": [
+        "What did I tell you about my morning routine?",
+        "Do you remember my goals from last time?",
+        "What is my favorite color?",
+        "Remind me what we talked about yesterday.",
+        "What did I say my biggest struggle was?",
+        "How am I doing on the plan we made?",
+        "What do you know about me?",
+        "My name is Sam and I work nights.",
+        "I told you earlier that I want to run a marathon.",
+        "What were my preferences again?",
+    ],
+    "WEB_SEARCH": [
+        "What is the weather today?",
+        "Who won the game last night?",
+        "What is the latest news about the stock market?",
+        "How tall is the Eiffel Tower?",
+        "What time does the pharmacy close?",
+        "Find me a recipe for banana bread.",
+        "What is the capital of Australia?",
+        "How much does a flight to Tokyo cost?",
+        "What are the opening hours of the museum?",
+        "Who is the current president of France?",
+    ],
+}
+
+logger = logging.getLogger(__name__)
+
+
+class LocalClassifier:
+    """
+    Keyword and nearest-centroid classifier for routing a voice turn.
+
+    The query embedding is compared against one centroid per label. A whole-word
+    keyword hit, the hint the LLM classifier is also given, adds CLASSIFIER_KEYWORD_BONUS
+    to the ATOMIC_HABITS similarity rather than deciding on its own, so "my morning
+    routine" can still be PERSONAL. The gap between the best and second-best
+    similarity is the confidence.
+    """
+
+    def __init__(self, embed: Callable[[str], List[float]], examples: Dict[str, List[str]] = LABEL_EXAMPLES):
+        self.embed = embed
+        self.examples = examples
+        self._labels = None
+        self._centroids = None
+        self._lock = threading.Lock()
+
+    def _ensure_centroids(self):
+        if self._centroids is None:
+            with self._lock:
+                if self._centroids is None:
+                    import numpy as np
+
+                    labels, centroids = [], []
+                    for label, texts in self.examples.items():
+                        vectors = np.asarray([self.embed(text) for text in texts], dtype=np.float32)
+                        centroid = vectors.mean(axis=0)
+                        labels.append(label)
+                        centroids.append(centroid / np.linalg.norm(centroid))
+                    self._labels = labels
+                    self._centroids = np.vstack(centroids)
+
+    @staticmethod
+    def keyword_score(text: str, keywords: List[str]) -> int:
+        """Number of keywords that appear in the text as whole words (or their plural), case-insensitively."""
+        lowered = text.lower()
+        return sum(1 for keyword in keywords
+                   if re.search(r"\b" + re.escape(keyword.lower()) + r"s?\b", lowered))
+
+    def predict(self, text: str, keywords: List[str], embedding=None) -> Tuple[str, float]:
+        """Return (label, confidence), the confidence being the margin between the two best labels."""
+        import numpy as np
+
+        self._ensure_centroids()
+        vector = np.asarray(embedding if embedding is not None else self.embed(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector = vector / norm
+        scores = self._centroids @ vector
+        if "ATOMIC_HABITS" in self._labels and self.keyword_score(text, keywords):
+            scores[self._labels.index("ATOMIC_HABITS")] += CLASSIFIER_KEYWORD_BONUS
+        order = np.argsort(-scores)
+        margin = float(scores[order[0]] - scores[order[1]]) if len(order) > 1 else 1.0
+        return self._labels[order[0]], margin
+
+
+class ClassifierStats:
+    """Per-path call counts and latency, plus agreement between local and LLM labels."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.paths = {}
+        self.compared = 0
+        self.agreed = 0
+
+    def record(self, path: str, seconds: float):
+        with self._lock:
+            count, total = self.paths.get(path, (0, 0.0))
+            self.paths[path] = (count + 1, total + seconds)
+
+    def record_agreement(self, local_label: str, llm_label: str):
+        with self._lock:
+            self.compared += 1
+            self.agreed += int(local_label == llm_label)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "paths": {
+                    path: {"count": count, "avg_ms": 1000 * total / count}
+                    for path, (count, total) in self.paths.items()
+                },
+                "compared": self.compared,
+                "agreement_rate": self.agreed / self.compared if self.compared else None,
+            }
+
+
+stats = ClassifierStats()
+
+
+def classify_hybrid(text: str, keywords: List[str], classify_llm: Callable[[str, List[str]], str],
+                    local: LocalClassifier, embedding=None) -> str:
+    """
+    Classify locally and only fall back to the LLM when the local confidence is below
+    CLASSIFIER_MIN_MARGIN. Returns the label.
+    """
+    if CLASSIFIER_MODE.lower() == "llm":
+        start = time.perf_counter()
+        label = classify_llm(text, keywords)
+        stats.record("llm", time.perf_counter() - start)
+        return label
+
+    start = time.perf_counter()
+    local_label, confidence = local.predict(text, keywords, embedding=embedding)
+    stats.record("local", time.perf_counter() - start)
+
+    if confidence >= CLASSIFIER_MIN_MARGIN:
+        if CLASSIFIER_SHADOW_RATE and random.random() < CLASSIFIER_SHADOW_RATE:
+            threading.Thread(target=_shadow_check, args=(text, keywords, classify_llm, local_label),
+                             daemon=True).start()
+        return local_label
+
+    start = time.perf_counter()
+    llm_label = classify_llm(text, keywords)
+    stats.record("llm_fallback", time.perf_counter() - start)
+    stats.record_agreement(local_label, llm_label)
+    logger.info(f"Low-confidence local label {local_label} ({confidence:.3f}), LLM chose {llm_label}")
+    return llm_label
+
+
+def _shadow_check(text: str, keywords: List[str], classify_llm: Callable, local_label: str):
+    """Compare a confident local label with the LLM off the request path."""
+    try:
+        stats.record_agreement(local_label, classify_llm(text, keywords))
+    except Exception as e:
+        logger.error(f"Shadow classification failed: {e}")
@@ -0,0 +1,179 @@
+import os
+import re
+import time
+import hashlib
+import logging
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional
+
+# Constants
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", 2048))
+EMBEDDING_CACHE_DISK_SIZE = int(os.getenv("EMBEDDING_CACHE_DISK_SIZE", 100000))
+EMBEDDING_CACHE_DB = os.getenv("EMBEDDING_CACHE_DB", "data/databases/embedding_cache.db")
+EMBEDDING_CACHE_TOUCH_INTERVAL = float(os.getenv("EMBEDDING_CACHE_TOUCH_INTERVAL", 3600))  # seconds between last_used refreshes of a row
+EVICTION_CHECK_INTERVAL = 256  # disk puts between size checks
+SCHEMA_VERSION = 2  # 2: vectors stored as float64
+
+logger = logging.getLogger(__name__)
+
+_whitespace = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace and case so repeated voice phrases share one entry."""
+    return _whitespace.sub(" ", text).strip().casefold()
+
+
+def cache_key(model: str, text: str) -> str:
+    return hashlib.sha256(f"{model}\0{normalize_text(text)}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache.
+
+    Tier one is an in-process LRU. Tier two is a SQLite file in WAL mode, so it
+    survives restarts and is shared by every worker on the host. Both tiers keep
+    the full float64 vector, so a hit returns exactly what was put. A disk hit
+    refreshes last_used, which orders disk eviction, at most once per
+    EMBEDDING_CACHE_TOUCH_INTERVAL rather than writing on every read.
+    """
+
+    def __init__(self, max_entries: int = EMBEDDING_CACHE_SIZE, db_path: Optional[str] = EMBEDDING_CACHE_DB,
+                 max_disk_entries: int = EMBEDDING_CACHE_DISK_SIZE):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.db_path = db_path
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._puts_since_check = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if db_path:
+            Path(os.path.dirname(db_path) or ".").mkdir(parents=True, exist_ok=True)
+            conn = self._connection()
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                # Rows in an older vector format are dropped rather than converted; it is only a cache
+                conn.execute("DROP TABLE IF EXISTS embeddings")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.execute("""CREATE TABLE IF NOT EXISTS embeddings (
+                                key TEXT PRIMARY KEY,
+                                model TEXT,
+                                vector BLOB,
+                                last_used REAL)""")
+            conn.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+            conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        """SQLite connections cannot be shared across threads, so keep one per thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _remember(self, key: str, vector: tuple):
+        with self._lock:
+            self._memory[key] = vector
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+                self.evictions += 1
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        key = cache_key(model, text)
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return list(vector)
+
+        if self.db_path:
+            try:
+                conn = self._connection()
+                row = conn.execute("SELECT vector, last_used FROM embeddings WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    now = time.time()
+                    if now - row[1] > EMBEDDING_CACHE_TOUCH_INTERVAL:
+                        conn.execute("UPDATE embeddings SET last_used = ? WHERE key = ?", (now, key))
+                        conn.commit()
+                    vector = tuple(array("d", row[0]))
+                    self._remember(key, vector)
+                    with self._lock:
+                        self.disk_hits += 1
+                    return list(vector)
+            except sqlite3.Error as e:
+                logger.error(f"Embedding cache read failed: {e}")
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, model: str, text: str, embedding: List[float]):
+        key = cache_key(model, text)
+        self._remember(key, tuple(embedding))
+
+        if self.db_path:
+            try:
+                conn = self._connection()
+                conn.execute("INSERT OR REPLACE INTO embeddings (key, model, vector, last_used) VALUES (?, ?, ?, ?)",
+                             (key, model, array("d", embedding).tobytes(), time.time()))
+                conn.commit()
+                with self._lock:
+                    self._puts_since_check += 1
+                    check = self._puts_since_check >= EVICTION_CHECK_INTERVAL
+                    if check:
+                        self._puts_since_check = 0
+                if check:
+                    self._evict_disk(conn)
+            except sqlite3.Error as e:
+                logger.error(f"Embedding cache write failed: {e}")
+
+    def _evict_disk(self, conn: sqlite3.Connection):
+        """Drop the least recently used rows once the disk tier is over its bound."""
+        count = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        overflow = count - self.max_disk_entries
+        if overflow > 0:
+            conn.execute("""DELETE FROM embeddings WHERE key IN (
+                                SELECT key FROM embeddings ORDER BY last_used ASC LIMIT ?)""", (overflow,))
+            conn.commit()
+            with self._lock:
+                self.evictions += overflow
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "memory_size": len(self._memory),
+                "memory_capacity": self.max_entries,
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Process-wide embedding cache, created on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = EmbeddingCache()
+    return _cache
@@ -0,0 +1,171 @@
+"""
+In-process BM25 keyword index over the Atomic Habits book chunks.
+
+Vector search alone often misses exact-term questions ("Two-Minute Rule",
+"habit stacking"). This index scores chunks by BM25 and is fused with the
+vector ranking through reciprocal-rank fusion in query_book_chunks. Fusion
+needs both rankings to use the same ids, so it only happens when the index is
+built from the local chunk store (python -m app.rag.local_book_index); an index
+over BOOK_TEXT_FILE is used alone, when the embedding call fails. Warm-up runs
+check_fusion(), so a deployment without the chunk store reports the failed
+"hybrid_search" step on /ready instead of silently serving vector-only results.
+
+BM25 term weights do not depend on the query, so they are computed once at
+build time; a search only sums precomputed weights from a few posting lists.
+"""
+import os
+import re
+import math
+import logging
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.rag import local_book_index
+
+# Constants
+HYBRID_SEARCH_ENABLED = os.getenv("HYBRID_SEARCH_ENABLED", "true").lower() == "true"
+HYBRID_DEPTH = int(os.getenv("HYBRID_DEPTH", 10))  # candidates taken from each ranking before fusion
+RRF_K = int(os.getenv("RRF_K", 60))
+BM25_K1 = float(os.getenv("BM25_K1", 1.2))
+BM25_B = float(os.getenv("BM25_B", 0.75))
+BOOK_TEXT_FILE = os.getenv("BOOK_TEXT_FILE", "data/atomic_habits.txt")
+TEXT_CHUNK_WORDS = 250
+TEXT_CHUNK_PREFIX = "txt-"  # ids of chunks cut from BOOK_TEXT_FILE, distinct from vector ids
+
+STOPWORDS = frozenset("""
+a about after again all also am an and any are as at be because been before being but by can could did do does
+doing down during each few for from further had has have having he her here hers him his how i if in into is it
+its itself just me more most my no nor not now of off on once only or other our out over own same she should so
+some such than that the their them then there these they this those through to too under until up very was we
+were what when where which while who whom why will with would you your yours
+""".split())
+
+logger = logging.getLogger(__name__)
+
+_token_pattern = re.compile(r"[a-z0-9]+")
+_keyword_index = None
+_keyword_index_lock = threading.Lock()
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords, with plural 's' stripped so "habits" matches "habit"."""
+    tokens = []
+    for token in _token_pattern.findall(text.lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+class BM25Index:
+    """Inverted index of term -> [(document position, BM25 weight)]."""
+
+    def __init__(self, documents: Dict[str, str], k1: float = BM25_K1, b: float = BM25_B,
+                 shares_vector_ids: bool = False):
+        self.ids = list(documents)
+        self.texts = documents
+        self.shares_vector_ids = shares_vector_ids  # ids are the book vector index's chunk ids
+
+        term_frequencies = [Counter(tokenize(documents[doc_id])) for doc_id in self.ids]
+        lengths = [sum(tf.values()) for tf in term_frequencies]
+        average_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+        document_frequency = Counter(term for tf in term_frequencies for term in tf)
+
+        postings = defaultdict(list)
+        total = len(self.ids)
+        for position, tf in enumerate(term_frequencies):
+            length_norm = k1 * (1 - b + b * lengths[position] / average_length) if average_length else k1
+            for term, count in tf.items():
+                df = document_frequency[term]
+                idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+                postings[term].append((position, idf * count * (k1 + 1) / (count + length_norm)))
+        self.postings = dict(postings)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def search(self, query: str, top_k: int = HYBRID_DEPTH) -> List[Tuple[str, float]]:
+        """Return the top_k (id, score) pairs for query, best first."""
+        scores = defaultdict(float)
+        for term, query_count in Counter(tokenize(query)).items():
+            for position, weight in self.postings.get(term, ()):
+                scores[position] += weight * query_count
+        best = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+        return [(self.ids[position], score) for position, score in best]
+
+    def get(self, doc_id: str) -> Optional[str]:
+        return self.texts.get(doc_id)
+
+
+def chunk_text_file(path: str = BOOK_TEXT_FILE, words_per_chunk: int = TEXT_CHUNK_WORDS) -> Dict[str, str]:
+    """Cut the book text into consecutive fixed-size word windows, ids txt-0, txt-1, ..."""
+    with open(path, "r", encoding="utf-8") as book_file:
+        words = book_file.read().split()
+    return {
+        f"{TEXT_CHUNK_PREFIX}{n}": " ".join(words[start:start + words_per_chunk])
+        for n, start in enumerate(range(0, len(words), words_per_chunk))
+    }
+
+
+def get_keyword_index() -> Optional[BM25Index]:
+    """
+    Build the keyword index once per process.
+    Uses the local chunk store when it has been built (ids then match the vector
+    index, so both rankings fuse on the same chunks), otherwise BOOK_TEXT_FILE.
+    Returns None if neither is available (checked only once).
+    """
+    global _keyword_index
+    if _keyword_index is None:
+        with _keyword_index_lock:
+            if _keyword_index is None:
+                documents = local_book_index.get_chunk_store()
+                source = local_book_index.BOOK_INDEX_DIR
+                shares_vector_ids = documents is not None
+                if documents is None:
+                    try:
+                        documents = chunk_text_file()
+                        source = BOOK_TEXT_FILE
+                        logger.warning(f"No book chunk store in {local_book_index.BOOK_INDEX_DIR}; keyword search "
+                                       f"uses {BOOK_TEXT_FILE} as a fallback only and is not fused with vector search")
+                    except FileNotFoundError:
+                        logger.warning(f"No book chunks or {BOOK_TEXT_FILE} found, keyword search disabled")
+                        _keyword_index = False
+                        return None
+                _keyword_index = BM25Index(documents, shares_vector_ids=shares_vector_ids)
+                logger.info(f"Built BM25 index over {len(_keyword_index)} book chunks from {source}")
+    return _keyword_index or None
+
+
+def check_fusion():
+    """Raise if hybrid search is enabled but its rankings cannot be fused (startup check, app/warmup.py)."""
+    if not HYBRID_SEARCH_ENABLED:
+        return
+    index = get_keyword_index()
+    if index is None or not index.shares_vector_ids:
+        raise RuntimeError(f"Hybrid search needs the book chunk store in {local_book_index.BOOK_INDEX_DIR} "
+                           "(python -m app.rag.local_book_index); keyword and vector rankings are not fused")
+
+
+def reciprocal_rank_fusion(*rankings: Iterable[str], k: int = RRF_K) -> List[Tuple[str, float]]:
+    """Fuse ranked id lists: each id scores sum(1 / (k + rank)) over the rankings it appears in."""
+    fused = defaultdict(float)
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            fused[doc_id] += 1.0 / (k + rank)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
+
+
+def hybrid_ranking(vector_ids: List[str], keyword_ids: List[str], shares_vector_ids: bool) -> List[str]:
+    """
+    Final chunk ranking for query_book_chunks. The rankings are fused only when
+    their ids name the same chunks; otherwise the keyword ranking is used only
+    when there is no vector ranking (the embedding call failed).
+    """
+    if not vector_ids:
+        return list(keyword_ids)
+    if not keyword_ids or not shares_vector_ids:
+        return list(vector_ids)
+    return [chunk_id for chunk_id, _ in reciprocal_rank_fusion(vector_ids, keyword_ids)]
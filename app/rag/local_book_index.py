@@ -0,0 +1,198 @@
+import os
+import json
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Constants
+BOOK_INDEX_DIR = os.getenv("BOOK_INDEX_DIR", "data/book_index")
+BOOK_INDEX_MODE = os.getenv("BOOK_INDEX_MODE", "pinecone")  # "pinecone" or "local"
+BOOK_VECTOR_COUNT = 1452  # number of vectors in the ah-test index
+VECTORS_FILE = "vectors.f32"
+MANIFEST_FILE = "manifest.json"
+CHUNKS_FILE = "chunks.json"
+FETCH_BATCH_SIZE = 100
+
+logger = logging.getLogger(__name__)
+
+_local_index = None
+_local_index_lock = threading.Lock()
+_chunk_store = None
+_chunk_store_namespace = None
+_total_vector_counts = {}  # namespace -> vector count
+
+
+class LocalBookIndex:
+    """
+    Read-only, memory-mapped copy of the Atomic Habits book embeddings.
+
+    The vectors live in one contiguous float32 matrix on disk, so every worker
+    process that opens it shares the same page-cache pages.
+    """
+
+    def __init__(self, index_dir: str = BOOK_INDEX_DIR):
+        import numpy as np
+
+        with open(os.path.join(index_dir, MANIFEST_FILE), "r") as manifest_file:
+            manifest = json.load(manifest_file)
+
+        self.ids = manifest["ids"]
+        self.dim = manifest["dim"]
+        self.namespace = manifest.get("namespace", "")
+        self.vectors = np.memmap(os.path.join(index_dir, VECTORS_FILE),
+                                 dtype=np.float32,
+                                 mode="r",
+                                 shape=(len(self.ids), self.dim))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def query(self, vector, top_k: int = 1) -> List[Tuple[str, float]]:
+        """
+        Return the top_k (id, score) pairs by cosine similarity.
+        Stored vectors are normalized at build time, so a dot product is enough.
+        """
+        if not len(self.ids) or top_k <= 0:
+            return []
+
+        import numpy as np
+
+        query_vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(query_vector)
+        if norm:
+            query_vector = query_vector / norm
+
+        scores = self.vectors @ query_vector
+        top_k = min(top_k, len(self.ids))
+        if top_k < len(self.ids):
+            candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            candidates = np.arange(len(self.ids))
+        ordered = candidates[np.argsort(-scores[candidates])]
+        return [(self.ids[i], float(scores[i])) for i in ordered]
+
+
+def local_mode_enabled() -> bool:
+    """Whether book retrieval should use the local index instead of Pinecone."""
+    return BOOK_INDEX_MODE.lower() == "local"
+
+
+def get_local_book_index(namespace: Optional[str] = None) -> Optional[LocalBookIndex]:
+    """
+    Lazily open the local book index once per process.
+    Returns None if it has not been built yet (checked only once), or if it was
+    exported from a namespace other than the one asked for.
+    """
+    global _local_index
+    if _local_index is None:
+        with _local_index_lock:
+            if _local_index is None:
+                try:
+                    _local_index = LocalBookIndex(BOOK_INDEX_DIR)
+                    logger.info(f"Loaded local book index with {len(_local_index)} vectors from {BOOK_INDEX_DIR}")
+                except FileNotFoundError:
+                    logger.warning(f"Local book index not found in {BOOK_INDEX_DIR}, falling back to Pinecone")
+                    _local_index = False
+    if _local_index and namespace is not None and _local_index.namespace != namespace:
+        return None
+    return _local_index or None
+
+
+def get_chunk_store(namespace: Optional[str] = None) -> Optional[Dict[str, str]]:
+    """
+    Load the id -> chunk text map once per process.
+    Returns None if it has not been built yet, or if it was exported from a
+    namespace other than the one asked for.
+    """
+    global _chunk_store, _chunk_store_namespace
+    if _chunk_store is None:
+        with _local_index_lock:
+            if _chunk_store is None:
+                try:
+                    with open(os.path.join(BOOK_INDEX_DIR, MANIFEST_FILE), "r") as manifest_file:
+                        _chunk_store_namespace = json.load(manifest_file).get("namespace", "")
+                    with open(os.path.join(BOOK_INDEX_DIR, CHUNKS_FILE), "r") as chunks_file:
+                        _chunk_store = json.load(chunks_file)
+                    logger.info(f"Loaded {len(_chunk_store)} book chunks from {BOOK_INDEX_DIR}")
+                except FileNotFoundError:
+                    logger.warning(f"Book chunk store not found in {BOOK_INDEX_DIR}, falling back to Pinecone fetch")
+                    _chunk_store = False
+    if _chunk_store and namespace is not None and _chunk_store_namespace != namespace:
+        return None
+    return _chunk_store if _chunk_store is not False else None
+
+
+def get_total_vector_count(index, namespace: str) -> int:
+    """
+    Number of vectors in a namespace of the book index, computed once per process.
+    Uses the local chunk store when it holds that namespace instead of describe_index_stats().
+    """
+    if namespace not in _total_vector_counts:
+        chunk_store = get_chunk_store(namespace)
+        if chunk_store is not None:
+            _total_vector_counts[namespace] = len(chunk_store)
+        else:
+            stats = index.describe_index_stats()
+            namespace_stats = stats.get('namespaces', {}).get(namespace)
+            _total_vector_counts[namespace] = namespace_stats['vector_count'] if namespace_stats else stats.get('total_vector_count', 0)
+    return _total_vector_counts[namespace]
+
+
+def build_local_book_index(index, namespace: str, total: int = BOOK_VECTOR_COUNT, index_dir: str = BOOK_INDEX_DIR):
+    """
+    Export every vector of the Pinecone book index into the local memory-mapped format,
+    along with the chunk text stored in its metadata.
+    Files are written next to the target and swapped in atomically.
+    """
+    os.makedirs(index_dir, exist_ok=True)
+    ids, rows, chunks = [], [], {}
+
+    for start in range(0, total, FETCH_BATCH_SIZE):
+        batch_ids = [str(i) for i in range(start, min(start + FETCH_BATCH_SIZE, total))]
+        fetched = index.fetch(ids=batch_ids, namespace=namespace)['vectors']
+        for vector_id in batch_ids:
+            if vector_id in fetched:
+                ids.append(vector_id)
+                rows.append(fetched[vector_id]['values'])
+                chunks[vector_id] = (fetched[vector_id].get('metadata') or {}).get('text', '')
+
+    if not ids:
+        raise ValueError(f"No vectors fetched from namespace {namespace!r}; "
+                         f"check the namespace name and that the index is populated")
+    if len(ids) != total:
+        raise ValueError(f"Fetched {len(ids)} of {total} vectors from namespace {namespace!r}; "
+                         f"ids are expected to run from 0 to {total - 1}")
+
+    import numpy as np
+
+    matrix = np.asarray(rows, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+
+    vectors_path = os.path.join(index_dir, VECTORS_FILE)
+    manifest_path = os.path.join(index_dir, MANIFEST_FILE)
+    chunks_path = os.path.join(index_dir, CHUNKS_FILE)
+    matrix.tofile(vectors_path + ".tmp")
+    with open(manifest_path + ".tmp", "w") as manifest_file:
+        json.dump({"ids": ids, "dim": int(matrix.shape[1]), "namespace": namespace}, manifest_file)
+    with open(chunks_path + ".tmp", "w") as chunks_file:
+        json.dump(chunks, chunks_file)
+    os.replace(vectors_path + ".tmp", vectors_path)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    os.replace(chunks_path + ".tmp", chunks_path)
+
+    logger.info(f"Wrote {len(ids)} vectors to {index_dir}")
+    return len(ids)
+
+
+if __name__ == "__main__":
+    # python -m app.rag.local_book_index [namespace]
+    import sys
+    from pinecone import Pinecone
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+    pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
+    build_local_book_index(pc.Index("ah-test"), namespace=sys.argv[1] if len(sys.argv) > 1 else "ah-test")
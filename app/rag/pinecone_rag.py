@@ -1,32 +1,32 @@
-import openai
 import os
-import tiktoken
 from datetime import datetime, date
 from typing import List, Literal
 from pydantic import BaseModel, Field
-import instructor
-from pinecone import Pinecone
 from dotenv import load_dotenv
-from openai import OpenAI
-from groq import Groq
 import requests
 import json
+from app import clients, metrics
+from app.rag import local_book_index, keyword_index, classifier, token_budget
+from app.rag.embedding_cache import get_embedding_cache
 
 load_dotenv()
 
-# Initialize the Pinecone client
-pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
+# Pinecone, OpenAI and Instructor clients come from the shared registry (app/clients.py)
+_lazy_clients = {
+    "pc": clients.get_pinecone,
+    "user_index": clients.get_user_index,
+    "book_index": clients.get_book_index,
+    "client_openai": clients.get_openai,
+    "client": clients.get_instructor,
+}
 
-user_index = pc.Index("user-data-openai-embedding")
-book_index = pc.Index("ah-test")
 
-# Initialize the Clients (OpenAI, Instructor, Groq, SentenceTransformer)
-openai.api_key = os.getenv("OPENAI_API_KEY")
+def __getattr__(name):
+    """Resolve the module-level client names other modules use, on first access."""
+    if name in _lazy_clients:
+        return _lazy_clients[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Initialize OpenAI
-client_openai = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-client = instructor.from_openai(
-    client_openai)  # Apply the patch to the OpenAI client
 
 # Initialize Groq
 # client_groq = Groq(api_key=os.getenv("GROQ_API_KEY"))
@@ -43,10 +43,38 @@ class ClassificationResponse(BaseModel):
     )
 
 
+_local_classifier = None
+
+
+def get_local_classifier() -> classifier.LocalClassifier:
+    """The process-wide local classifier; its label centroids are embedded on first use."""
+    global _local_classifier
+    if _local_classifier is None:
+        _local_classifier = classifier.LocalClassifier(get_embedding)
+    return _local_classifier
+
+
+# Classification for branch path
+@metrics.span("classify")
+def classify(data: str, keywords: List[str], embedding=None) -> ClassificationResponse:
+    """
+    Perform single-label classification on the input text.
+    Uses the local keyword/centroid classifier and only calls the LLM when it is unsure.
+    Pass the query embedding if it has already been computed for retrieval.
+    """
+    label = classifier.classify_hybrid(
+        data,
+        keywords,
+        classify_llm=lambda text, kw: classify_llm(text, kw).label,
+        local=get_local_classifier(),
+        embedding=embedding)
+    return ClassificationResponse(label=label)
+
+
 # Classification LLM for branch path
-def classify(data: str, keywords: List[str]) -> ClassificationResponse:
-    """Perform single-label classification on the input text."""
-    return client.chat.completions.create(
+def classify_llm(data: str, keywords: List[str]) -> ClassificationResponse:
+    """Perform single-label classification on the input text with the LLM."""
+    return clients.get_instructor().chat.completions.create(
         # model="gpt-3.5-turbo",
         model='gpt-4o',
         response_model=ClassificationResponse,
@@ -127,23 +155,34 @@ def classify(data: str, keywords: List[str]) -> ClassificationResponse:
         return {"success": False, "error": str(e)}
 
 
+@metrics.span("get_embedding")
 def get_embedding(text, model="text-embedding-ada-002"):
+    cache = get_embedding_cache()
+    embedding = cache.get(model, text)
+    if embedding is not None:
+        return embedding
+
     print("This is TEXT", text)
-    response = client_openai.embeddings.create(input=[text], model=model)
-    return response.data[0].embedding
+    response = clients.get_openai().embeddings.create(input=[text],
+                                                 model=model)
+    embedding = response.data[0].embedding
+    cache.put(model, text, embedding)
+    return embedding
 
 
+@metrics.span("query_pinecone_user")
 def query_pinecone_user(query_string,
                         index,
                         top_k=10,
                         namespace="",
-                        filter={"user_id": "fake_user_id"}):
-    xc = get_embedding(query_string)
-    result = user_index.query(vector=xc,
-                              top_k=top_k,
-                              include_metadata=True,
-                              namespace=namespace,
-                              filter=filter)
+                        filter={"user_id": "fake_user_id"},
+                        embedding=None):
+    xc = embedding if embedding is not None else get_embedding(query_string)
+    result = clients.get_user_index().query(vector=xc,
+                                            top_k=top_k,
+                                            include_metadata=True,
+                                            namespace=namespace,
+                                            filter=filter)
     return result
 
 
@@ -152,66 +191,139 @@ def query_pinecone_user(query_string,
 #     result = book_index.query(vector=xc, top_k=top_k, include_metadata=True, namespace=namespace)
 #     print(result)
 #     return result
-def query_pinecone_book(query_string,
-                        index,
-                        top_k=1,
-                        namespace="default-namespace"):
+@metrics.span("query_pinecone_book")
+def query_book_chunks(query_string,
+                      index,
+                      top_k=1,
+                      namespace="default-namespace",
+                      embedding=None,
+                      embed=True):
     """
-    Query Pinecone index and combine strings from top similarity vector and the next two sequential indices.
+    Find the best matching chunk in the book index and expand it with the next two sequential chunks.
+
+    When the keyword index shares the vector ids (local chunk store), the vector
+    ranking is fused with a BM25 keyword ranking (reciprocal-rank fusion) so
+    exact-term questions like "Two-Minute Rule" still land on the right chunk.
+    If the embedding call fails, or embed is False and no embedding is given,
+    the keyword ranking is used alone.
 
     Args:
-        vector (list): The vector to query.
+        query_string (str): The text to query.
         top_k (int): Number of top results to fetch initially.
         namespace (str): The namespace to query.
+        embedding (list): Precomputed embedding of query_string, if available.
+        embed (bool): Whether to embed query_string when no embedding is given.
 
     Returns:
-        str: Combined strings from the top index and the next two indices, if conditions are met.
+        list: (chunk_id, text) pairs for the top index and the next two indices, empty if nothing matched.
     """
-    # Ensure the function is aware of the global book_index
-    xc = get_embedding(query_string)
-
-    # Query the Pinecone index
-    result = index.query(vector=xc,
-                         top_k=top_k,
-                         include_metadata=True,
-                         namespace=namespace)
+    bm25 = keyword_index.get_keyword_index() if keyword_index.HYBRID_SEARCH_ENABLED else None
+    # Fusion needs BM25 and vector ids to name the same chunks (index built from this namespace's chunk store)
+    fuse = bm25 is not None and bm25.shares_vector_ids and local_book_index.get_chunk_store(namespace) is not None
+    keyword_ids = []
+    if fuse:
+        with metrics.span("bm25"):
+            keyword_ids = [chunk_id for chunk_id, _ in bm25.search(query_string, top_k=keyword_index.HYBRID_DEPTH)]
+        top_k = max(top_k, keyword_index.HYBRID_DEPTH)
 
-    if not result or not result.matches:
-        return "No results found."
+    try:
+        if embedding is None and not embed:
+            raise ValueError("no query embedding")
+        xc = embedding if embedding is not None else get_embedding(query_string)
+    except Exception as e:
+        if bm25 is None:
+            raise
+        print(f"Embedding unavailable, using keyword search only: {e}")
+        if not keyword_ids:
+            with metrics.span("bm25"):
+                keyword_ids = [chunk_id for chunk_id, _ in bm25.search(query_string, top_k=keyword_index.HYBRID_DEPTH)]
+        xc = None
+
+    vector_ids = []
+    # Prefer the in-process memory-mapped index when it has been built
+    local_index = local_book_index.get_local_book_index(
+        namespace) if local_book_index.local_mode_enabled() else None
+    if xc is not None and local_index is not None:
+        vector_ids = [chunk_id for chunk_id, _ in local_index.query(xc, top_k=top_k)]
+    elif xc is not None:
+        # Query the Pinecone index for ids only; chunk text is looked up below
+        result = index.query(vector=xc,
+                             top_k=top_k,
+                             include_metadata=False,
+                             namespace=namespace)
+        if result and result.matches:
+            vector_ids = [match.id for match in result.matches]
+
+    ranked_ids = keyword_index.hybrid_ranking(vector_ids, keyword_ids, fuse)
+    if not ranked_ids:
+        return []
+
+    if ranked_ids[0].startswith(keyword_index.TEXT_CHUNK_PREFIX):
+        # Chunk cut from the book text file; its neighbors live in the keyword index
+        position = int(ranked_ids[0][len(keyword_index.TEXT_CHUNK_PREFIX):])
+        chunk_ids = [f"{keyword_index.TEXT_CHUNK_PREFIX}{n}" for n in range(position, position + 3)]
+        return [(chunk_id, bm25.get(chunk_id)) for chunk_id in chunk_ids if bm25.get(chunk_id)]
 
-    # Extract the top similarity match
-    top_match = result.matches[0]
     top_index = int(
-        top_match.id
+        ranked_ids[0]
     )  # Assuming the IDs are integers or convertible to integers
-    index_stats = index.describe_index_stats().get('total_vector_count', 0)
-    # print('**********INDEX STATS***********',index_stats)
-    # print("**********TOP MATCH*************",top_match)
-    # Check if the top index is 1451
-    if top_index >= 1452:  # 1452 number of vectors in AH index
-        return f"Top index {top_index} is restricted. No combined string returned."
+    total_vector_count = local_book_index.get_total_vector_count(
+        index, namespace)
+    # Check if the top index is past the end of the AH index
+    if top_index >= total_vector_count:
+        print(f"Top index {top_index} is restricted. No combined string returned.")
+        return []
 
     # Fetch strings for indices top_index, top_index + 1, top_index + 2
     indices_to_fetch = [top_index, top_index + 1, top_index + 2]
-    # print(indices_to_fetch)
-    combined_strings = []
+    chunks = []
+
+    chunk_store = local_book_index.get_chunk_store(namespace)
+    if chunk_store is not None:
+        # Neighbor expansion is a dictionary lookup, no network calls
+        for chunk_id in indices_to_fetch:
+            text = chunk_store.get(str(chunk_id))
+            if text:
+                chunks.append((str(chunk_id), text))
+        return chunks
 
     for index in indices_to_fetch:
         # Query each specific index to fetch its metadata (e.g., string content)
-        individual_result = book_index.fetch(ids=[str(index)],
-                                             namespace=namespace)
+        individual_result = clients.get_book_index().fetch(
+            ids=[str(index)], namespace=namespace)
         # print(individual_result)
-        if individual_result:
+        if individual_result and str(index) in individual_result['vectors']:
             # Assuming the metadata contains a 'text' field with the string content
             text = individual_result['vectors'][str(index)]['metadata']['text']
             print("**********TEXT***********", text)
-            # print("**********INDEX STATS***********",individual_result['metadata'])
 
             if text:
-                combined_strings.append(text)
+                chunks.append((str(index), text))
+
+    return chunks
+
+
+def query_pinecone_book(query_string,
+                        index,
+                        top_k=1,
+                        namespace="default-namespace"):
+    """
+    Query Pinecone index and combine strings from top similarity vector and the next two sequential indices.
+
+    Args:
+        vector (list): The vector to query.
+        top_k (int): Number of top results to fetch initially.
+        namespace (str): The namespace to query.
+
+    Returns:
+        str: Combined strings from the top index and the next two indices, if conditions are met.
+    """
+    chunks = query_book_chunks(query_string, index, top_k=top_k, namespace=namespace)
+    if not chunks:
+        return "No results found."
 
     # Combine the fetched strings into a single string
-    return combined_strings
+    return [text for _, text in chunks]
 
 
 def construct_prompt(data, query):
@@ -222,34 +334,27 @@ def get_context_string(contexts: List[str]) -> str:
     return " ".join(contexts)
 
 
-async def manage_conversation_tokens(conversation: List[str],
-                                     call_id: str) -> List[str]:
-
-    def num_tokens_from_messages(messages, tkmodel="cl100k_base"):
-        encoding = tiktoken.get_encoding(tkmodel)
-        num_tokens = 0
-        for message in messages:
-            num_tokens += 4  # every message follows <im_start>{role/name}\\n{content}<im_end>\\n
-            for key, value in message.items():
-                num_tokens += len(encoding.encode(value))
-                if key == "name":  # if there's a name, the role is omitted
-                    num_tokens += -1  # role is always required and always 1 token
-        return num_tokens + 2  # every reply is primed with <im_start>assistant
-
-    conv_history_tokens = num_tokens_from_messages(conversation)
+async def manage_conversation_tokens(
+        conversation: List[str],
+        call_id: str,
+        token_limit: int = token_budget.TOKEN_LIMIT,
+        max_response_tokens: int = token_budget.RESPONSE_RESERVE) -> List[str]:
+    """
+    Trim the oldest messages (keeping the system prompt) so the conversation plus
+    max_response_tokens fits in token_limit, summarizing if it still does not fit.
+    """
+    conv_history_tokens = token_budget.trim_conversation(
+        conversation,
+        token_limit=token_limit,
+        response_reserve=max_response_tokens)
     print("tokens: " + str(conv_history_tokens))
-    token_limit = 32000
-    max_response_tokens = 300
-    while (conv_history_tokens + max_response_tokens >= token_limit):
-        del conversation[1]
-        conv_history_tokens = num_tokens_from_messages(conversation)
 
     # Summarize if necessary
     if conv_history_tokens + max_response_tokens >= token_limit:
         summarization = summarize_conversation(conversation)
         summary_embedding = get_embedding(summarization)
         idv = "id" + "this_is_a_temp_id"  #str(time.time())
-        user_index.upsert(vectors=[{
+        clients.get_user_index().upsert(vectors=[{
             "id": idv,
             "values": summary_embedding,
             "metadata": {
@@ -270,7 +375,7 @@ def summarize_conversation(context: List[str]) -> str:
     today = date.today()
     date_string = str(today)
 
-    completion = client.chat.completions.create(
+    completion = clients.get_instructor().chat.completions.create(
         # engine="gpt-3.5-turbo",
         model="gpt-3.5-turbo",
         prompt=
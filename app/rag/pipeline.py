@@ -0,0 +1,118 @@
+import os
+import time
+import asyncio
+import logging
+import functools
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from app.rag import pinecone_rag
+
+logger = logging.getLogger(__name__)
+
+USER_NAMESPACE = "user-data-openai-embedding"
+BOOK_NAMESPACE = "ah-test"
+PIPELINE_WORKERS = int(os.getenv("PIPELINE_WORKERS", 16))
+EMBED_TIMEOUT = float(os.getenv("EMBED_TIMEOUT", 5.0))  # seconds before retrieval falls back to keyword search
+
+# Dedicated pool so a discarded retrieval never holds up event loop shutdown
+_executor = ThreadPoolExecutor(max_workers=PIPELINE_WORKERS, thread_name_prefix="retrieval")
+
+
+async def _timed(timings: dict, stage: str, func, *args, **kwargs):
+    """Run a blocking call in a worker thread and record how long it took."""
+    start = time.perf_counter()
+    # Carry context variables (the request's metrics timer) into the worker thread
+    context = contextvars.copy_context()
+    result = await asyncio.get_running_loop().run_in_executor(
+        _executor, functools.partial(context.run, func, *args, **kwargs))
+    timings[stage] = time.perf_counter() - start
+    return result
+
+
+def _discard(task: asyncio.Task):
+    """Cancel a retrieval the label ruled out and swallow whatever it ends with."""
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+async def retrieve_context(query_string: str, keywords: List[str], user_index, book_index, top_k: int = 1) -> dict:
+    """
+    Classify a query and retrieve its grounding context concurrently.
+
+    The query is embedded once. Classification and both the user-index and
+    book-index retrievals then start together; once the label is known the
+    retrieval it rules out is cancelled (or its result discarded if it is
+    already running in a thread), so the critical path is roughly
+    embed + max(classify, retrieval) instead of their sum.
+
+    If embedding fails or takes longer than EMBED_TIMEOUT, classification and the
+    user-index retrieval, which both need the vector, are skipped and the book
+    is searched by keyword only; the label is then ATOMIC_HABITS if that found
+    anything, else None.
+
+    Returns:
+        dict: label, contexts, context_ids, embedding (None if embedding failed) and per-stage timings in seconds.
+    """
+    timings = {}
+    pipeline_start = time.perf_counter()
+
+    try:
+        embedding = await asyncio.wait_for(
+            _timed(timings, "embed", pinecone_rag.get_embedding, query_string), EMBED_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"Query embedding failed ({e!r}), retrieving by keyword only")
+        book_chunks = await _timed(timings, "retrieve_book", pinecone_rag.query_book_chunks, query_string,
+                                   book_index, top_k=top_k, namespace=BOOK_NAMESPACE, embed=False)
+        timings["total"] = time.perf_counter() - pipeline_start
+        return {
+            "label": "ATOMIC_HABITS" if book_chunks else None,
+            "contexts": [text for _, text in book_chunks],
+            "context_ids": [chunk_id for chunk_id, _ in book_chunks],
+            "embedding": None,
+            "timings": timings,
+        }
+
+    classify_task = asyncio.create_task(
+        _timed(timings, "classify", pinecone_rag.classify, query_string, keywords, embedding=embedding))
+    user_task = asyncio.create_task(
+        _timed(timings, "retrieve_user", pinecone_rag.query_pinecone_user, query_string, user_index,
+               top_k=top_k, namespace=USER_NAMESPACE, embedding=embedding))
+    book_task = asyncio.create_task(
+        _timed(timings, "retrieve_book", pinecone_rag.query_book_chunks, query_string, book_index,
+               top_k=top_k, namespace=BOOK_NAMESPACE, embedding=embedding))
+
+    try:
+        label = (await classify_task).label
+    except Exception:
+        _discard(user_task)
+        _discard(book_task)
+        raise
+
+    contexts, context_ids = [], []
+    if label == "PERSONAL":
+        _discard(book_task)
+        res = await user_task
+        contexts = [x['metadata']['text'] for x in res['matches']]
+        context_ids = [x['id'] for x in res['matches']]
+    elif label == "ATOMIC_HABITS":
+        _discard(user_task)
+        book_chunks = await book_task
+        contexts = [text for _, text in book_chunks]
+        context_ids = [chunk_id for chunk_id, _ in book_chunks]
+    else:
+        _discard(user_task)
+        _discard(book_task)
+
+    timings["total"] = time.perf_counter() - pipeline_start
+    logger.info(f"Retrieval pipeline ({label}) timings: " +
+                ", ".join(f"{stage}={seconds * 1000:.1f}ms" for stage, seconds in timings.items()))
+
+    return {
+        "label": label,
+        "contexts": contexts,
+        "context_ids": context_ids,
+        "embedding": embedding,
+        "timings": timings,
+    }
@@ -0,0 +1,136 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict, namedtuple
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Constants
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", 0.95))
+SEMANTIC_CACHE_TTL = float(os.getenv("SEMANTIC_CACHE_TTL", 3600))  # seconds
+SEMANTIC_CACHE_SIZE = int(os.getenv("SEMANTIC_CACHE_SIZE", 1024))
+
+logger = logging.getLogger(__name__)
+
+CacheEntry = namedtuple("CacheEntry", ["vector", "bucket", "response", "created"])
+
+
+class SemanticResponseCache:
+    """
+    Replays earlier answers for near-identical questions.
+
+    Entries are bucketed by (classification label, retrieved context ids, scope), so a
+    hit needs the same grounding context and a query embedding above the similarity
+    threshold. The scope (cache_scope()) covers the rest of the prompt, system prompt
+    and earlier turns included, and ties PERSONAL answers to the user they were
+    generated for.
+    """
+
+    def __init__(self, threshold: float = SEMANTIC_CACHE_THRESHOLD, ttl: float = SEMANTIC_CACHE_TTL,
+                 max_entries: int = SEMANTIC_CACHE_SIZE):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._buckets = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _bucket(label: str, context_ids: List[str], scope: str) -> tuple:
+        return (label, tuple(context_ids), scope)
+
+    @staticmethod
+    def _unit(embedding) -> "np.ndarray":
+        import numpy as np
+
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _drop(self, entry_id: int):
+        entry = self._entries.pop(entry_id)
+        bucket = self._buckets.get(entry.bucket)
+        if bucket is not None:
+            bucket.discard(entry_id)
+            if not bucket:
+                del self._buckets[entry.bucket]
+
+    def lookup(self, embedding, label: str, context_ids: List[str], scope: str = "") -> Optional[str]:
+        """Return a cached answer if a fresh entry in the same bucket is similar enough."""
+        query = self._unit(embedding)
+        now = time.time()
+        with self._lock:
+            best_id, best_score = None, self.threshold
+            for entry_id in list(self._buckets.get(self._bucket(label, context_ids, scope), ())):
+                entry = self._entries[entry_id]
+                if now - entry.created > self.ttl:
+                    self._drop(entry_id)
+                    continue
+                score = float(entry.vector @ query)
+                if score >= best_score:
+                    best_id, best_score = entry_id, score
+
+            if best_id is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(best_id)
+            self.hits += 1
+            return self._entries[best_id].response
+
+    def store(self, embedding, label: str, context_ids: List[str], response: str, scope: str = ""):
+        if not response:
+            return
+        bucket = self._bucket(label, context_ids, scope)
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = CacheEntry(self._unit(embedding), bucket, response, time.time())
+            self._buckets.setdefault(bucket, set()).add(entry_id)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def cache_enabled() -> bool:
+    return SEMANTIC_CACHE_ENABLED
+
+
+def cache_scope(label: str, user_id: Optional[str], prompt_messages: List[dict]) -> Optional[str]:
+    """
+    Scope for a cache entry: a hash of prompt_messages, everything sent to the model
+    before the final question (system prompt and earlier turns). An answer is only
+    replayed for the same prompt, so a follow-up like "say more about that" never gets
+    an answer given in another conversation, and any per-user content in the system
+    prompt stays with that user. PERSONAL answers are also only ever replayed to the
+    same user, and never cached without a user id.
+    """
+    prompt = hashlib.sha256(json.dumps(prompt_messages, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    if label == "PERSONAL":
+        return f"user:{user_id}:{prompt}" if user_id else None
+    return prompt
+
+
+def get_response_cache() -> SemanticResponseCache:
+    """Process-wide semantic response cache, created on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SemanticResponseCache()
+    return _cache
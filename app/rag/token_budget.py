@@ -0,0 +1,70 @@
+import os
+from functools import lru_cache
+from typing import List, Tuple
+
+# Constants
+TOKEN_LIMIT = int(os.getenv("CONVERSATION_TOKEN_LIMIT", 32000))
+RESPONSE_RESERVE = int(os.getenv("CONVERSATION_RESPONSE_RESERVE", 300))
+MESSAGE_TOKEN_CACHE_SIZE = int(os.getenv("MESSAGE_TOKEN_CACHE_SIZE", 65536))
+DEFAULT_ENCODING = "cl100k_base"
+
+
+@lru_cache(maxsize=None)
+def get_encoding(name: str = DEFAULT_ENCODING):
+    """tiktoken encoders are expensive to build; load each one once per process, on first use."""
+    import tiktoken
+
+    return tiktoken.get_encoding(name)
+
+
+@lru_cache(maxsize=MESSAGE_TOKEN_CACHE_SIZE)
+def _count_message_tokens(items: Tuple[Tuple[str, str], ...], encoding_name: str) -> int:
+    encoding = get_encoding(encoding_name)
+    num_tokens = 4  # every message follows <im_start>{role/name}\n{content}<im_end>\n
+    for key, value in items:
+        num_tokens += len(encoding.encode(value))
+        if key == "name":  # if there's a name, the role is omitted
+            num_tokens += -1  # role is always required and always 1 token
+    return num_tokens
+
+
+def message_tokens(message: dict, encoding_name: str = DEFAULT_ENCODING) -> int:
+    """
+    Token count of one chat message, memoized on its contents, so a message
+    is only encoded once however many turns it stays in the conversation.
+    """
+    items = tuple((key, value) for key, value in message.items() if isinstance(value, str))
+    return _count_message_tokens(items, encoding_name)
+
+
+def num_tokens_from_messages(messages: List[dict], encoding_name: str = DEFAULT_ENCODING) -> int:
+    return sum(message_tokens(message, encoding_name) for message in messages) + 2  # every reply is primed with <im_start>assistant
+
+
+def trim_conversation(conversation: List[dict],
+                      token_limit: int = TOKEN_LIMIT,
+                      response_reserve: int = RESPONSE_RESERVE,
+                      encoding_name: str = DEFAULT_ENCODING) -> int:
+    """
+    Drop the oldest messages in place until the conversation plus the response
+    reserve fits under token_limit.
+
+    The first message (the system prompt) and the latest message are always kept.
+    Every message is counted once and the cut point is found in a single pass.
+
+    Returns:
+        int: Token count of the trimmed conversation.
+    """
+    counts = [message_tokens(message, encoding_name) for message in conversation]
+    total = sum(counts) + 2
+    budget = token_limit - response_reserve
+
+    cut = 1
+    last = len(conversation) - 1
+    while total >= budget and cut < last:
+        total -= counts[cut]
+        cut += 1
+
+    if cut > 1:
+        del conversation[1:cut]
+    return total
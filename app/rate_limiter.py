@@ -0,0 +1,51 @@
+"""
+Async token-bucket rate limiting for third-party APIs with per-minute quotas.
+
+The bucket holds up to `capacity` tokens and refills at `rate` tokens per
+second; acquire() waits until a token is available. A 429 from the API can
+pause the bucket until the server's reset time, so every caller waits instead
+of each one running into the limit separately, and the bucket then resumes
+with the fresh quota.
+"""
+import time
+import asyncio
+
+
+class TokenBucket:
+    """Token bucket for coroutines on one event loop."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate  # tokens per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, tokens: float = 1.0):
+        """Wait until `tokens` are available and take them; callers are served in arrival order."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+    def pause(self, seconds: float, refill: bool = False):
+        """
+        Hand out no tokens for `seconds`. Afterwards the bucket starts from empty,
+        or from full with refill=True (the server said its quota resets by then).
+        """
+        now = time.monotonic()
+        self.paused_until = max(self.paused_until, now + seconds)
+        self.tokens = self.capacity if refill else 0.0
+        self.updated = self.paused_until
@@ -0,0 +1,104 @@
+"""
+Record of tool call ids already dispatched, per Vapi call.
+
+Every tool-calls webhook carries the whole call history in artifact.messages,
+so without this each earlier tool call would run again on every new one.
+Ids are kept in memory per call (least recently active calls evicted first)
+and, when TOOL_CALL_SEEN_DB is set, also in SQLite so that several worker
+processes and restarts agree on what has already run.
+"""
+import os
+import time
+import asyncio
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from typing import Iterable, Optional, Set
+
+# Constants
+TOOL_CALL_SEEN_DB = os.getenv("TOOL_CALL_SEEN_DB", "")  # empty: in-memory only
+TOOL_CALL_SEEN_MAX_CALLS = int(os.getenv("TOOL_CALL_SEEN_MAX_CALLS", 10000))
+TOOL_CALL_SEEN_TTL = float(os.getenv("TOOL_CALL_SEEN_TTL", 7 * 24 * 3600))  # seconds kept in SQLite
+
+logger = logging.getLogger(__name__)
+
+
+class SeenToolCalls:
+    """
+    claim() atomically marks tool call ids as dispatched and returns the ones that
+    were not seen before. A call is claimed before it runs, so it runs at most once.
+    """
+
+    def __init__(self, db_path: Optional[str] = TOOL_CALL_SEEN_DB, max_calls: int = TOOL_CALL_SEEN_MAX_CALLS,
+                 ttl: float = TOOL_CALL_SEEN_TTL):
+        self.db_path = db_path or None
+        self.max_calls = max_calls
+        self.ttl = ttl
+        self._calls = OrderedDict()  # call id -> set of tool call ids
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        if self.db_path:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = self._connection()
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS seen_tool_calls ("
+                "call_id TEXT NOT NULL, tool_call_id TEXT NOT NULL, created_at REAL NOT NULL, "
+                "PRIMARY KEY (call_id, tool_call_id))")
+            conn.execute("DELETE FROM seen_tool_calls WHERE created_at < ?", (time.time() - self.ttl,))
+            conn.commit()
+
+    @property
+    def persistent(self) -> bool:
+        return self.db_path is not None
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread, reused across calls
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def claim(self, call_id: str, tool_call_ids: Iterable[str]) -> Set[str]:
+        """Mark tool_call_ids as dispatched for call_id; return those not seen before."""
+        with self._lock:
+            seen = self._calls.get(call_id)
+            if seen is None:
+                seen = self._calls[call_id] = set()
+                while len(self._calls) > self.max_calls:
+                    self._calls.popitem(last=False)
+            else:
+                self._calls.move_to_end(call_id)
+            candidates = {tool_call_id for tool_call_id in tool_call_ids if tool_call_id not in seen}
+            seen.update(candidates)
+
+        if not candidates or not self.persistent:
+            return candidates
+
+        # Another process may have claimed some of them already; the primary key decides
+        new = set()
+        try:
+            conn = self._connection()
+            now = time.time()
+            with conn:
+                for tool_call_id in candidates:
+                    cursor = conn.execute(
+                        "INSERT OR IGNORE INTO seen_tool_calls (call_id, tool_call_id, created_at) VALUES (?, ?, ?)",
+                        (call_id, tool_call_id, now))
+                    if cursor.rowcount:
+                        new.add(tool_call_id)
+        except sqlite3.Error as e:
+            logger.error(f"Seen tool call store unavailable, using in-memory record: {e}")
+            return candidates
+        return new
+
+    async def aclaim(self, call_id: str, tool_call_ids: Iterable[str]) -> Set[str]:
+        """claim() for the event loop; SQLite work runs in a worker thread."""
+        if self.persistent:
+            return await asyncio.to_thread(self.claim, call_id, list(tool_call_ids))
+        return self.claim(call_id, tool_call_ids)
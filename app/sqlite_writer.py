@@ -0,0 +1,201 @@
+"""
+Write-behind batching for small SQLite inserts.
+
+Tables are registered at import (insert statement built) and created by
+create_tables() at startup (app/warmup.py), or by the writer thread before its
+first write if startup has not got to it yet, so importing does no I/O. Rows submitted from any thread or the event loop are queued to one writer
+thread per process, which keeps a long-lived WAL-mode connection per database
+file and commits everything that arrived within the flush interval in one
+transaction per file. BEGIN IMMEDIATE plus a busy timeout lets several worker
+processes write to the same files safely.
+"""
+import os
+import time
+import queue
+import atexit
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from concurrent.futures import Future
+from typing import Dict, List, Sequence
+
+# Constants
+SQLITE_FLUSH_INTERVAL = float(os.getenv("SQLITE_FLUSH_INTERVAL", 0.02))
+SQLITE_BATCH_SIZE = int(os.getenv("SQLITE_BATCH_SIZE", 500))
+SQLITE_BUSY_TIMEOUT = float(os.getenv("SQLITE_BUSY_TIMEOUT", 5.0))
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, timeout=SQLITE_BUSY_TIMEOUT, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class SQLiteWriter:
+    """One writer thread per process batching inserts into registered tables."""
+
+    def __init__(self, flush_interval: float = SQLITE_FLUSH_INTERVAL, batch_size: int = SQLITE_BATCH_SIZE):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.tables = {}  # key -> (db_path, insert sql)
+        self._schemas = {}  # key -> (db_path, create table sql)
+        self._created = set()  # keys whose table exists
+        self.transactions = 0
+        self.rows_written = 0
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def register_table(self, key: str, db_path: str, table: str, schema: str):
+        """
+        Prepare the insert statement for a table; create_tables() creates it.
+        Columns are taken from the schema, skipping AUTOINCREMENT ones.
+        """
+        columns = [col.split()[0] for col in schema.split(",") if "AUTOINCREMENT" not in col.upper()]
+        placeholders = ", ".join("?" for _ in columns)
+        self.tables[key] = (db_path, f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})")
+        self._schemas[key] = (db_path, f"CREATE TABLE IF NOT EXISTS {table} ({schema})")
+
+    def create_tables(self):
+        """Create every registered table that does not exist yet; a failure is logged and retried next time."""
+        with self._lock:
+            for key, (db_path, create_sql) in self._schemas.items():
+                if key in self._created:
+                    continue
+                try:
+                    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+                    conn = _connect(db_path)
+                    try:
+                        conn.execute(create_sql)
+                    finally:
+                        conn.close()
+                    self._created.add(key)
+                except (OSError, sqlite3.Error) as e:
+                    logger.error(f"Failed to create table for {key!r} in {db_path}: {e}")
+
+    def _ensure_started(self):
+        # Connections are not shared across a fork; each process starts its own writer
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._queue = queue.SimpleQueue()
+                    self._thread = threading.Thread(target=self._run, name="sqlite-writer", daemon=True)
+                    self._thread.start()
+                    self._pid = os.getpid()
+                    atexit.register(self.close)
+
+    def submit(self, key: str, rows: Sequence[tuple]) -> Future:
+        """
+        Queue rows for the registered table key. Never blocks.
+        The returned future resolves to True once they are committed, False if the write failed.
+        """
+        future = Future()
+        if key not in self.tables:
+            future.set_exception(KeyError(f"No table registered for {key!r}"))
+            return future
+        if not rows:
+            future.set_result(True)
+            return future
+        self._ensure_started()
+        self._queue.put((key, list(rows), future))
+        return future
+
+    def close(self, timeout: float = 5.0):
+        """Commit what is queued and stop the writer thread."""
+        if self._pid != os.getpid() or not self._thread.is_alive():
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def stats(self) -> dict:
+        return {"transactions": self.transactions, "rows_written": self.rows_written}
+
+    def _run(self):
+        connections = {}
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            rows = len(item[1])
+            # Collect whatever else arrives within the flush interval into the same transaction
+            deadline = time.monotonic() + self.flush_interval
+            while rows < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+                rows += len(item[1])
+            self._flush(batch, connections)
+
+        for conn in connections.values():
+            conn.close()
+
+    def _flush(self, batch, connections: Dict[str, sqlite3.Connection]):
+        if len(self._created) < len(self._schemas):
+            self.create_tables()
+
+        by_database: Dict[str, List] = {}
+        for key, rows, future in batch:
+            by_database.setdefault(self.tables[key][0], []).append((key, rows, future))
+
+        for db_path, items in by_database.items():
+            try:
+                conn = connections.get(db_path)
+                if conn is None:
+                    conn = connections[db_path] = _connect(db_path)
+            except sqlite3.Error as e:
+                logger.error(f"Failed to open {db_path}: {e}")
+                for _, _, future in items:
+                    future.set_result(False)
+                continue
+
+            try:
+                self._commit(conn, items)
+            except Exception as e:
+                if len(items) == 1:
+                    logger.error(f"Failed to write to {db_path}: {e}")
+                    items[0][2].set_result(False)
+                    continue
+                # One bad request must not fail the others batched with it
+                logger.warning(f"Batch write to {db_path} failed ({e}), retrying requests one by one")
+                for item in items:
+                    try:
+                        self._commit(conn, [item])
+                    except Exception as item_error:
+                        logger.error(f"Failed to write to {db_path}: {item_error}")
+                        item[2].set_result(False)
+                    else:
+                        item[2].set_result(True)
+                continue
+
+            for _, _, future in items:
+                future.set_result(True)
+
+    def _commit(self, conn: sqlite3.Connection, items):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for key, rows, _ in items:
+                conn.executemany(self.tables[key][1], rows)
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        self.transactions += 1
+        self.rows_written += sum(len(rows) for _, rows, _ in items)
@@ -0,0 +1,69 @@
+"""
+Typed, compiled decoding of Vapi server webhook payloads.
+
+Vapi resends the whole call history (artifact.messages, messagesOpenAIFormatted)
+on every webhook, so payloads grow each turn. These structs declare only the
+fields the webhook handlers read; msgspec skips everything else without
+building Python objects for it, which keeps decoding fast and flat in memory
+however long the call gets. Fields Vapi may send as null are Optional and
+the handlers normalise them, so a null never fails the whole request.
+"""
+from typing import Any, Dict, List, Optional
+
+import msgspec
+
+
+class ToolFunction(msgspec.Struct):
+    name: Optional[str] = None
+    arguments: Any = None  # JSON object, or a string holding one
+
+
+class ToolCall(msgspec.Struct):
+    id: Optional[str] = None
+    function: ToolFunction = msgspec.field(default_factory=ToolFunction)
+
+
+class ArtifactMessage(msgspec.Struct):
+    toolCalls: List[ToolCall] = []
+
+
+class Artifact(msgspec.Struct):
+    messages: List[ArtifactMessage] = []
+
+
+class FunctionCall(msgspec.Struct):
+    name: Optional[str] = None
+    parameters: Optional[Dict[str, Any]] = None
+
+
+class Call(msgspec.Struct):
+    id: Optional[str] = None
+
+
+class AssistantInfo(msgspec.Struct):
+    metadata: Optional[Dict[str, Any]] = None
+
+
+class WebhookMessage(msgspec.Struct):
+    type: Optional[str] = None
+    toolCalls: List[ToolCall] = []
+    toolCall: Optional[FunctionCall] = None
+    artifact: Artifact = msgspec.field(default_factory=Artifact)
+    call: Optional[Call] = None
+    summary: Optional[str] = None
+    assistant: Optional[AssistantInfo] = None
+    output: Any = None  # model-output, echoed back as is
+
+
+class WebhookRequest(msgspec.Struct):
+    message: Optional[WebhookMessage] = None
+
+
+_decoder = msgspec.json.Decoder(WebhookRequest)
+
+DecodeError = msgspec.DecodeError  # raised for malformed JSON and for fields of the wrong type
+
+
+def decode_webhook(body: bytes) -> WebhookRequest:
+    """Decode a raw webhook request body."""
+    return _decoder.decode(body)
@@ -0,0 +1,158 @@
+"""
+Startup warm-up and readiness.
+
+The first request after a deploy used to pay for TLS handshakes to OpenAI and
+Pinecone, loading the tiktoken encoder and building the local indexes. warm_up()
+does all of that once per worker before it reports ready on /ready, so a
+rolling restart only sends traffic to warm workers.
+"""
+import os
+import time
+import asyncio
+import logging
+import threading
+
+from app import clients, event_loop
+
+# Constants
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+WARMUP_TEXT = "warm up"
+EMBEDDING_MODEL = "text-embedding-ada-002"
+CHAT_MODEL = "gpt-4o"
+
+logger = logging.getLogger(__name__)
+
+_ready = threading.Event()
+_started_pid = None
+_lock = threading.Lock()
+_steps = {}  # step name -> {"ok": bool, "seconds": float[, "error": str]}
+
+
+def _load_encoders():
+    from app.rag import token_budget
+
+    token_budget.get_encoding()
+
+
+def _load_local_indexes():
+    from app.rag import local_book_index, keyword_index, embedding_cache, response_cache
+
+    if local_book_index.local_mode_enabled():
+        local_book_index.get_local_book_index()
+    local_book_index.get_chunk_store()
+    if keyword_index.HYBRID_SEARCH_ENABLED:
+        keyword_index.get_keyword_index()
+    embedding_cache.get_embedding_cache()
+    response_cache.get_response_cache()
+
+
+def _check_hybrid_search():
+    from app.rag import keyword_index
+
+    keyword_index.check_fusion()
+
+
+def _warm_openai():
+    # Bypasses the embedding cache so the pooled connection is really opened
+    clients.get_openai().embeddings.create(input=[WARMUP_TEXT], model=EMBEDDING_MODEL)
+
+
+async def _warm_async_openai():
+    await clients.get_async_openai().models.retrieve(CHAT_MODEL)
+
+
+def _warm_pinecone():
+    from app.rag import local_book_index, pipeline
+
+    clients.get_user_index().describe_index_stats()
+    if not local_book_index.local_mode_enabled():
+        local_book_index.get_total_vector_count(clients.get_book_index(), pipeline.BOOK_NAMESPACE)
+        clients.get_book_index().describe_index_stats()
+
+
+def _warm_classifier():
+    from app.rag import classifier, pinecone_rag
+
+    if classifier.CLASSIFIER_MODE == "local":
+        # Embeds the label examples into centroids
+        pinecone_rag.get_local_classifier().predict(WARMUP_TEXT, [])
+
+
+def _create_tool_tables():
+    from app.api import webhook
+
+    webhook.tool_store.create_tables()
+
+
+def _load_character_index():
+    from app.functions import character_index
+
+    character_index.get_index()
+
+
+STEPS = {
+    "encoders": _load_encoders,
+    "local_indexes": _load_local_indexes,
+    "hybrid_search": _check_hybrid_search,
+    "openai": _warm_openai,
+    "async_openai": _warm_async_openai,
+    "pinecone": _warm_pinecone,
+    "classifier": _warm_classifier,
+    "character_index": _load_character_index,
+    "tool_tables": _create_tool_tables,
+}
+
+
+async def _run_step(name: str, step):
+    start = time.perf_counter()
+    try:
+        if asyncio.iscoroutinefunction(step):
+            await step()
+        else:
+            await asyncio.to_thread(step)
+        _steps[name] = {"ok": True, "seconds": round(time.perf_counter() - start, 3)}
+    except Exception as e:
+        logger.warning(f"Warm-up step {name} failed: {e}")
+        _steps[name] = {"ok": False, "seconds": round(time.perf_counter() - start, 3), "error": str(e)}
+
+
+async def warm_up():
+    """
+    Run every warm-up step concurrently, then mark the process ready.
+    A failed step is logged and reported by status() but does not hold readiness
+    back; the request that needs it pays the cost instead.
+    """
+    start = time.perf_counter()
+    await asyncio.gather(*(_run_step(name, step) for name, step in STEPS.items()))
+    _ready.set()
+    logger.info(f"Warm-up finished in {time.perf_counter() - start:.2f}s")
+
+
+def start():
+    """
+    Start warm-up on the shared event loop, once per process; returns immediately.
+    The ASGI and WSGI entry points call this when their server starts, so forked
+    workers each warm their own clients.
+    """
+    global _started_pid
+    if _started_pid == os.getpid():
+        return
+    with _lock:
+        if _started_pid == os.getpid():
+            return
+        _started_pid = os.getpid()
+        _ready.clear()
+        _steps.clear()
+
+    if not WARMUP_ENABLED:
+        _ready.set()
+        return
+    asyncio.run_coroutine_threadsafe(warm_up(), event_loop.get_loop())
+
+
+def is_ready() -> bool:
+    return _started_pid == os.getpid() and _ready.is_set()
+
+
+def status() -> dict:
+    return {"ready": is_ready(), "steps": dict(_steps)}
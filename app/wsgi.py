@@ -0,0 +1,16 @@
+"""
+WSGI entry point.
+
+    flask --app app.wsgi run
+    gunicorn app.wsgi:application --workers 4
+
+Importing this module creates the app and starts warm-up and the background job
+workers, so /ready turns 200 once the worker is warm rather than after its first
+request. Warm-up and the job workers are per process, so each worker must import
+it itself: with gunicorn --preload, forked workers would stay 503 on /ready.
+"""
+from app.main import app, start_background_work
+
+start_background_work()
+
+application = app
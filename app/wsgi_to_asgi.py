@@ -0,0 +1,122 @@
+"""
+WSGI-to-ASGI adapter for serving the Flask app from app/asgi.py.
+
+Each request runs on a thread of this process's WSGI_THREADS pool. asgiref's
+WsgiToAsgi runs every request on one thread-sensitive thread instead, so an
+async view blocking in run_coroutine() (up to a tool timeout) would queue every
+other Flask request, /ready and /metrics included, behind it. Response chunks
+are sent from the worker thread through the server's event loop as the WSGI
+app yields them.
+"""
+import io
+import os
+import sys
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# Constants
+WSGI_THREADS = int(os.getenv("WSGI_THREADS", 32))  # Flask requests handled at once per worker
+
+_executor = None
+_executor_pid = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor, _executor_pid
+    if _executor is None or _executor_pid != os.getpid():
+        _executor = ThreadPoolExecutor(max_workers=WSGI_THREADS, thread_name_prefix="wsgi")
+        _executor_pid = os.getpid()
+    return _executor
+
+
+async def read_body(receive) -> bytes:
+    """The whole request body of an ASGI http scope."""
+    body = b""
+    while True:
+        message = await receive()
+        body += message.get("body", b"")
+        if not message.get("more_body", False):
+            return body
+
+
+def build_environ(scope: dict, body: bytes) -> dict:
+    """PEP 3333 environ for an ASGI http scope; str values are latin-1 decoded as WSGI requires."""
+    server = scope.get("server") or ("localhost", 80)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+        "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1] or 80),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    if scope.get("client"):
+        environ["REMOTE_ADDR"], environ["REMOTE_PORT"] = scope["client"][0], str(scope["client"][1])
+
+    for raw_name, raw_value in scope.get("headers", []):
+        name, value = raw_name.decode("latin-1"), raw_value.decode("latin-1")
+        if name.lower() == "content-length":
+            key = "CONTENT_LENGTH"
+        elif name.lower() == "content-type":
+            key = "CONTENT_TYPE"
+        else:
+            key = "HTTP_" + name.upper().replace("-", "_")
+        # Repeated headers are joined, as a WSGI server would
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+class ThreadPoolWsgiToAsgi:
+    """ASGI application serving a WSGI application's http requests on the WSGI_THREADS pool."""
+
+    def __init__(self, wsgi_application):
+        self.wsgi_application = wsgi_application
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            raise ValueError(f"WSGI can only serve http requests, not {scope['type']}")
+        body = await read_body(receive)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(_get_executor(), self._run, scope, body, send, loop)
+
+    def _run(self, scope, body: bytes, send, loop: asyncio.AbstractEventLoop):
+        def send_now(message):
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        response = {}  # status and headers from start_response
+        started = False
+
+        def start_response(status, headers, exc_info=None):
+            if exc_info and started:
+                raise exc_info[1].with_traceback(exc_info[2])
+            response["status"] = int(status.split(" ", 1)[0])
+            response["headers"] = [(name.lower().encode("latin-1"), value.encode("latin-1"))
+                                   for name, value in headers]
+
+        def start():
+            send_now({"type": "http.response.start", "status": response["status"], "headers": response["headers"]})
+
+        iterable = self.wsgi_application(build_environ(scope, body), start_response)
+        try:
+            for chunk in iterable:
+                if not chunk:
+                    continue
+                if not started:
+                    start()
+                    started = True
+                send_now({"type": "http.response.body", "body": chunk, "more_body": True})
+        finally:
+            close = getattr(iterable, "close", None)
+            if close is not None:
+                close()
+        if not started:
+            start()
+        send_now({"type": "http.response.body", "body": b""})
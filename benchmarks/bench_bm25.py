@@ -0,0 +1,62 @@
+"""
+Benchmark the BM25 keyword leg of book retrieval.
+
+    python -m benchmarks.bench_bm25 [--iterations 2000]
+
+Builds the keyword index the way the server does (local chunk store if built,
+else data/atomic_habits.txt) and reports build time, per-query latency
+percentiles and the top chunk for a few exact-term questions.
+"""
+import argparse
+import time
+
+from app.rag import keyword_index
+
+QUERIES = [
+    "What is the Two-Minute Rule?",
+    "How does habit stacking work?",
+    "Explain the four laws of behavior change",
+    "What is the Goldilocks Rule for motivation?",
+    "identity-based habits versus outcome-based habits",
+    "How do I make a bad habit unattractive?",
+    "What does James Clear say about environment design?",
+    "plateau of latent potential",
+]
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = keyword_index.get_keyword_index()
+    build_seconds = time.perf_counter() - start
+    if index is None:
+        raise SystemExit("No book chunks available to index")
+    print(f"built BM25 index over {len(index)} chunks, {len(index.postings)} terms in {build_seconds * 1000:.0f} ms")
+
+    latencies = []
+    for i in range(args.iterations):
+        query = QUERIES[i % len(QUERIES)]
+        start = time.perf_counter()
+        index.search(query, top_k=keyword_index.HYBRID_DEPTH)
+        latencies.append(time.perf_counter() - start)
+
+    print(f"search over {args.iterations} queries: "
+          f"p50={percentile(latencies, 0.5) * 1e6:.0f} us  "
+          f"p99={percentile(latencies, 0.99) * 1e6:.0f} us  "
+          f"max={max(latencies) * 1e6:.0f} us")
+
+    for query in QUERIES[:3]:
+        chunk_id, score = index.search(query, top_k=1)[0]
+        print(f"\n{query!r} -> {chunk_id} (score {score:.2f})\n  {index.get(chunk_id)[:160]}...")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measure the cold-start import time of the app and fail past a budget.
+
+    python -m benchmarks.bench_import_time [--module app.main] [--budget-ms 1500] [--runs 5]
+
+Each run imports the module in a fresh interpreter under `python -X importtime`.
+The best run is compared with the budget, and the slowest imports of that run
+are listed. Exits with status 1 when the budget is exceeded, so it can gate CI.
+"""
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", 1500))
+
+# "import time: self [us] | cumulative | imported package"
+_line_pattern = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(module: str):
+    """Import module in a fresh interpreter; return (total_us, [(cumulative_us, self_us, name)])."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if completed.returncode != 0:
+        raise SystemExit(f"Importing {module} failed:\n{completed.stderr[-2000:]}")
+
+    # The module and its parent packages; interpreter startup (site, encodings) is not counted
+    parts = module.split(".")
+    own = {".".join(parts[:i]) for i in range(1, len(parts) + 1)}
+
+    imports, total = [], 0
+    for line in completed.stderr.splitlines():
+        match = _line_pattern.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = int(match[1]), int(match[2]), match[3], match[4]
+        imports.append((cumulative_us, self_us, name))
+        if len(indent) == 1 and name in own:  # top level: cumulative covers everything below it
+            total += cumulative_us
+    return total, imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_TIME_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(args.runs)]
+    total, imports = min(runs, key=lambda run: run[0])
+    total_ms = total / 1000
+
+    print(f"import {args.module}: best of {args.runs} = {total_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    print("\nslowest imports (cumulative ms, self ms):")
+    for cumulative_us, self_us, name in sorted(imports, reverse=True)[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} {self_us / 1000:8.1f}  {name}")
+
+    if total_ms > args.budget_ms:
+        print(f"\nFAIL: cold start regressed past the {args.budget_ms:.0f} ms budget")
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
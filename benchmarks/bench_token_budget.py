@@ -0,0 +1,88 @@
+"""
+Benchmark conversation token budgeting on long conversations.
+
+    python -m benchmarks.bench_token_budget [--messages 1000] [--limit 32000]
+
+Compares the previous implementation (re-encode the whole conversation after
+every single deletion) with app.rag.token_budget.trim_conversation, cold (empty
+token cache) and warm (the next turn of the same call).
+"""
+import argparse
+import random
+import time
+
+import tiktoken
+
+from app.rag import token_budget
+
+WORDS = ("habit identity system goal cue craving response reward environment "
+         "small improvement compound routine tracking stack rule minute").split()
+
+
+def make_conversation(n_messages: int, seed: int = 0):
+    rng = random.Random(seed)
+    conversation = [{"role": "system", "content": "You are a Personal Learning and Implementation Assistant."}]
+    for i in range(n_messages):
+        role = "user" if i % 2 == 0 else "assistant"
+        words = rng.randint(20, 120)
+        conversation.append({"role": role, "content": " ".join(rng.choice(WORDS) for _ in range(words)) + f" {i}"})
+    return conversation
+
+
+def legacy_trim(conversation, token_limit, max_response_tokens):
+    """The loop manage_conversation_tokens used before: quadratic in conversation length."""
+
+    def num_tokens_from_messages(messages, tkmodel="cl100k_base"):
+        encoding = tiktoken.get_encoding(tkmodel)
+        num_tokens = 0
+        for message in messages:
+            num_tokens += 4
+            for key, value in message.items():
+                num_tokens += len(encoding.encode(value))
+                if key == "name":
+                    num_tokens += -1
+        return num_tokens + 2
+
+    conv_history_tokens = num_tokens_from_messages(conversation)
+    while conv_history_tokens + max_response_tokens >= token_limit:
+        del conversation[1]
+        conv_history_tokens = num_tokens_from_messages(conversation)
+    return conv_history_tokens
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=32000)
+    parser.add_argument("--reserve", type=int, default=300)
+    args = parser.parse_args()
+
+    token_budget.get_encoding()  # load the encoder outside the timed region for both paths
+    tiktoken.get_encoding("cl100k_base")
+
+    legacy_conversation = make_conversation(args.messages)
+    legacy_tokens, legacy_seconds = timed(legacy_trim, legacy_conversation, args.limit, args.reserve)
+
+    new_conversation = make_conversation(args.messages)
+    new_tokens, cold_seconds = timed(token_budget.trim_conversation, new_conversation, args.limit, args.reserve)
+    assert legacy_tokens == new_tokens, (legacy_tokens, new_tokens)
+    assert legacy_conversation == new_conversation
+
+    # Next turn of the same call: one new message, everything else already counted
+    new_conversation.append({"role": "user", "content": "What is the Two-Minute Rule?"})
+    _, warm_seconds = timed(token_budget.trim_conversation, new_conversation, args.limit, args.reserve)
+
+    print(f"messages={args.messages} limit={args.limit} kept={len(legacy_conversation)} tokens={new_tokens}")
+    print(f"legacy (re-encode per deletion): {legacy_seconds * 1000:10.1f} ms")
+    print(f"trim_conversation (cold cache):  {cold_seconds * 1000:10.1f} ms  ({legacy_seconds / cold_seconds:.0f}x)")
+    print(f"trim_conversation (next turn):   {warm_seconds * 1000:10.1f} ms  ({legacy_seconds / warm_seconds:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
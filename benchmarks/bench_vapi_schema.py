@@ -0,0 +1,66 @@
+"""
+Benchmark loading the generated Vapi schema models eagerly vs on demand.
+
+    python -m benchmarks.bench_vapi_schema [--model ServerMessageModelOutput] [--runs 3]
+
+Each case runs in a fresh interpreter with pydantic already imported, and
+reports the time and peak RSS growth to get the model ready for validation:
+  eager: import app.response_data.vapi_schema_models (builds all 2159 models)
+  lazy:  from app.response_data.vapi_schema import <model> (builds only what it references)
+"""
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+CHILD = """
+import json, resource, time
+import pydantic
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+{statement}
+seconds = time.perf_counter() - start
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+import sys
+built = sum(1 for value in vars(sys.modules[{module!r}]).values()
+            if isinstance(value, type) and issubclass(value, pydantic.BaseModel) and value.__module__ == {module!r})
+print(json.dumps({{"seconds": seconds, "rss_kb": rss_after - rss_before, "models": built}}))
+"""
+
+CASES = {
+    "eager": ("import app.response_data.vapi_schema_models as schema; model = getattr(schema, {model!r})",
+              "app.response_data.vapi_schema_models"),
+    "lazy": ("from app.response_data.vapi_schema import {model} as model",
+             "app.response_data.vapi_schema"),
+}
+
+
+def run_case(statement: str, module: str) -> dict:
+    code = CHILD.format(statement=statement, module=module)
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                               cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="ServerMessageModelOutput")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    results = {}
+    for case, (statement, module) in CASES.items():
+        runs = [run_case(statement.format(model=args.model), module) for _ in range(args.runs)]
+        results[case] = min(runs, key=lambda run: run["seconds"])
+        best = results[case]
+        print(f"{case:5}: {best['seconds'] * 1000:8.1f} ms  +{best['rss_kb'] / 1024:6.1f} MiB RSS  "
+              f"{best['models']:5d} models built")
+
+    eager, lazy = results["eager"], results["lazy"]
+    print(f"\n{args.model}: {eager['seconds'] / lazy['seconds']:.1f}x faster, "
+          f"{(eager['rss_kb'] - lazy['rss_kb']) / 1024:.1f} MiB less memory on demand")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark decoding large Vapi webhook payloads.
+
+    python -m benchmarks.bench_webhook_decode [--messages 4000] [--runs 20]
+
+Builds a synthetic conversation-update payload whose artifact.messages and
+messagesOpenAIFormatted carry the whole call history (1MB+), then compares:
+  json:    json.loads into dicts, as request.get_json() did
+  msgspec: app.types.webhook.decode_webhook into typed structs
+Reports best parse time and peak traced memory for each.
+"""
+import json
+import time
+import random
+import argparse
+import tracemalloc
+
+from app.types.webhook import decode_webhook
+
+WORDS = "habit cue craving response reward identity system goal routine environment minute rule".split()
+
+
+def make_payload(n_messages: int, seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+    messages, openai_messages = [], []
+    for i in range(n_messages):
+        role = "user" if i % 2 == 0 else "bot"
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(10, 60)))
+        message = {"role": role, "message": text, "time": 1735000000000 + i * 1500,
+                   "endTime": 1735000000000 + i * 1500 + 1200, "secondsFromStart": i * 1.5, "duration": 1200}
+        if i % 50 == 49:
+            message = {"role": "tool_calls", "time": message["time"], "secondsFromStart": i * 1.5,
+                       "toolCalls": [{"id": f"call_{i}", "type": "function",
+                                      "function": {"name": "collect_user_info",
+                                                   "arguments": json.dumps({"key": "goal", "value": text[:40]})}}]}
+        messages.append(message)
+        openai_messages.append({"role": "user" if role == "user" else "assistant", "content": text})
+
+    payload = {"message": {
+        "type": "conversation-update",
+        "timestamp": 1735000000000,
+        "call": {"id": "call-1234", "orgId": "org-1", "type": "webCall", "status": "in-progress"},
+        "assistant": {"name": "Coach", "metadata": {"user_id": "user-42"}},
+        "messages": messages,
+        "messagesOpenAIFormatted": openai_messages,
+        "artifact": {"messages": messages, "messagesOpenAIFormatted": openai_messages},
+    }}
+    return json.dumps(payload).encode()
+
+
+def read_with_json(body: bytes):
+    message = json.loads(body)["message"]
+    tool_calls = [call for item in message.get("artifact", {}).get("messages", []) for call in item.get("toolCalls", [])]
+    return message.get("type"), message.get("call", {}).get("id"), len(tool_calls)
+
+
+def read_with_msgspec(body: bytes):
+    message = decode_webhook(body).message
+    tool_calls = [call for item in message.artifact.messages for call in item.toolCalls]
+    return message.type, message.call.id, len(tool_calls)
+
+
+def measure(func, body: bytes, runs: int):
+    best = min(_timed(func, body) for _ in range(runs))
+    tracemalloc.start()
+    result = func(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def _timed(func, body):
+    start = time.perf_counter()
+    func(body)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=4000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    body = make_payload(args.messages)
+    print(f"payload: {len(body) / 1024 / 1024:.2f} MiB, {args.messages} messages")
+
+    results = {}
+    for name, func in (("json", read_with_json), ("msgspec", read_with_msgspec)):
+        result, seconds, peak = measure(func, body, args.runs)
+        results[name] = (result, seconds, peak)
+        print(f"{name:8} {seconds * 1000:8.2f} ms  peak {peak / 1024 / 1024:7.2f} MiB  -> {result}")
+
+    assert results["json"][0] == results["msgspec"][0]
+    (_, json_seconds, json_peak), (_, fast_seconds, fast_peak) = results["json"], results["msgspec"]
+    print(f"\nmsgspec: {json_seconds / fast_seconds:.1f}x faster, {json_peak / max(fast_peak, 1):.1f}x less peak memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+import pytest
+
+from app.functions.schedule_clickup import Schedule
+
+
+@pytest.fixture
+def make_schedule():
+    """Build a Schedule with one list per argument, each a list of task dicts."""
+    def make(*lists):
+        return Schedule.model_validate({
+            "schedule_name": "Plan",
+            "lists": [{"list_name": f"List {index}", "tasks": tasks} for index, tasks in enumerate(lists)],
+        })
+    return make
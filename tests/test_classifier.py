@@ -0,0 +1,37 @@
+import re
+import zlib
+
+import numpy as np
+
+from app.rag.classifier import LABEL_EXAMPLES, LocalClassifier
+
+# The keyword hints the custom LLM route passes to the classifier
+KEYWORDS = ["habit", "Atomic Habits", "James Clear", "self-improvement", "routine", "productivity"]
+
+
+def embed(text: str) -> list:
+    """
+    Deterministic stand-in for the embedding model: hashed word counts, plus one
+    axis per label that its seed examples lie on, as a real model places them
+    near their label's centroid.
+    """
+    vector = np.zeros(256 + len(LABEL_EXAMPLES))
+    words = re.findall(r"[a-z]+", text.lower())
+    for word in words:
+        vector[zlib.crc32(word.encode()) % 256] += 1.0 / len(words)
+    for axis, examples in enumerate(LABEL_EXAMPLES.values()):
+        if text in examples:
+            vector[256 + axis] = 1.0
+    return vector.tolist()
+
+
+def test_personal_examples_classify_as_personal():
+    classifier = LocalClassifier(embed)
+    for text in LABEL_EXAMPLES["PERSONAL"]:
+        assert classifier.predict(text, KEYWORDS)[0] == "PERSONAL", text
+
+
+def test_keywords_match_whole_words_only():
+    assert LocalClassifier.keyword_score("Tell me about habit stacking", KEYWORDS) == 1
+    assert LocalClassifier.keyword_score("Two good habits", KEYWORDS) == 1
+    assert LocalClassifier.keyword_score("The habitat of a routinely productive owl", KEYWORDS) == 0
@@ -0,0 +1,23 @@
+import pytest
+
+from benchmarks import bench_import_time
+
+# Loaded on first use; importing any of them at startup puts it back on every cold start
+DEFERRED_MODULES = ("numpy", "httpx", "tiktoken", "llama_index")
+
+
+def imported(imports, module):
+    return any(name == module or name.startswith(module + ".") for _, _, name in imports)
+
+
+@pytest.mark.parametrize("module", ["app.rag.classifier", "app.rag.local_book_index", "app.rag.response_cache"])
+def test_retrieval_modules_defer_numpy(module):
+    _, imports = bench_import_time.measure(module)
+    assert not imported(imports, "numpy")
+
+
+def test_app_main_within_import_budget():
+    pytest.importorskip("flask")
+    total, imports = min((bench_import_time.measure("app.main") for _ in range(3)), key=lambda run: run[0])
+    assert [module for module in DEFERRED_MODULES if imported(imports, module)] == []
+    assert total / 1000 <= bench_import_time.IMPORT_TIME_BUDGET_MS
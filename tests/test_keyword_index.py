@@ -0,0 +1,48 @@
+import pytest
+
+from app.rag import keyword_index
+from app.rag.keyword_index import BM25Index, hybrid_ranking, reciprocal_rank_fusion
+
+CHUNKS = {
+    "0": "Habits are the compound interest of self-improvement.",
+    "1": "The Two-Minute Rule: when you start a new habit, it should take less than two minutes to do.",
+    "2": "Environment is the invisible hand that shapes human behavior.",
+    "3": "Small habits make a big difference over time.",
+}
+
+
+def test_keyword_hit_reaches_top_when_ids_are_shared():
+    index = BM25Index(CHUNKS, shares_vector_ids=True)
+    keyword_ids = [chunk_id for chunk_id, _ in index.search("What is the two-minute rule?")]
+    assert keyword_ids[0] == "1"
+
+    # The vector leg ranks the right chunk only fourth
+    vector_ids = ["3", "0", "2", "1"]
+    assert hybrid_ranking(vector_ids, keyword_ids, index.shares_vector_ids)[0] == "1"
+
+
+def test_keyword_only_ranking_is_used_when_there_is_no_vector_ranking():
+    index = BM25Index({f"txt-{n}": text for n, text in enumerate(CHUNKS.values())})
+    keyword_ids = [chunk_id for chunk_id, _ in index.search("two-minute rule")]
+    assert hybrid_ranking([], keyword_ids, index.shares_vector_ids)[0] == "txt-1"
+
+
+def test_rankings_over_different_ids_are_not_fused():
+    keyword_ids = ["txt-1", "txt-0"]
+    vector_ids = ["3", "0"]
+    assert hybrid_ranking(vector_ids, keyword_ids, shares_vector_ids=False) == vector_ids
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = reciprocal_rank_fusion(["a", "b", "c"], ["c", "b", "d"], k=60)
+    assert {chunk_id for chunk_id, _ in fused[:2]} == {"b", "c"}
+
+
+def test_check_fusion_fails_without_shared_ids(monkeypatch):
+    monkeypatch.setattr(keyword_index, "HYBRID_SEARCH_ENABLED", True)
+    monkeypatch.setattr(keyword_index, "_keyword_index", BM25Index({"txt-0": "habits"}))
+    with pytest.raises(RuntimeError, match="chunk store"):
+        keyword_index.check_fusion()
+
+    monkeypatch.setattr(keyword_index, "_keyword_index", BM25Index({"0": "habits"}, shares_vector_ids=True))
+    keyword_index.check_fusion()
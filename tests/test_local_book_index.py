@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from app.rag import local_book_index
+
+
+class FakeIndex:
+    def __init__(self, vectors):
+        self.vectors = vectors  # namespace -> {id: values}
+
+    def fetch(self, ids, namespace):
+        stored = self.vectors.get(namespace, {})
+        return {"vectors": {i: {"values": stored[i], "metadata": {"text": f"chunk {i}"}}
+                            for i in ids if i in stored}}
+
+
+@pytest.fixture
+def book_index_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(local_book_index, "BOOK_INDEX_DIR", str(tmp_path))
+    monkeypatch.setattr(local_book_index, "_local_index", None)
+    monkeypatch.setattr(local_book_index, "_chunk_store", None)
+    monkeypatch.setattr(local_book_index, "_total_vector_counts", {})
+    return tmp_path
+
+
+def test_build_fails_clearly_when_nothing_is_fetched(book_index_dir):
+    index = FakeIndex({"ah-test": {"0": [1.0, 0.0]}})
+    with pytest.raises(ValueError, match="No vectors fetched from namespace 'wrong'"):
+        local_book_index.build_local_book_index(index, "wrong", total=1, index_dir=str(book_index_dir))
+    assert not (book_index_dir / local_book_index.MANIFEST_FILE).exists()
+
+
+def test_build_fails_when_vectors_are_missing(book_index_dir):
+    index = FakeIndex({"ah-test": {"0": [1.0, 0.0], "1": [0.0, 1.0]}})
+    with pytest.raises(ValueError, match="Fetched 2 of 3"):
+        local_book_index.build_local_book_index(index, "ah-test", total=3, index_dir=str(book_index_dir))
+
+
+def test_other_namespaces_are_not_served_locally(book_index_dir):
+    index = FakeIndex({"ah-test": {"0": [1.0, 0.0], "1": [0.0, 1.0]}})
+    local_book_index.build_local_book_index(index, "ah-test", total=2, index_dir=str(book_index_dir))
+    assert json.loads((book_index_dir / local_book_index.MANIFEST_FILE).read_text())["namespace"] == "ah-test"
+
+    assert local_book_index.get_local_book_index("ah-test").query([0.0, 2.0])[0][0] == "1"
+    assert local_book_index.get_local_book_index("other") is None
+    assert local_book_index.get_chunk_store("ah-test") == {"0": "chunk 0", "1": "chunk 1"}
+    assert local_book_index.get_chunk_store("other") is None
+
+
+def test_vector_count_is_cached_per_namespace(book_index_dir):
+    local_book_index.build_local_book_index(FakeIndex({"ah-test": {"0": [1.0, 0.0]}}), "ah-test",
+                                            total=1, index_dir=str(book_index_dir))
+
+    class StatsIndex:
+        def describe_index_stats(self):
+            return {"namespaces": {"other": {"vector_count": 7}}}
+
+    assert local_book_index.get_total_vector_count(StatsIndex(), "ah-test") == 1
+    assert local_book_index.get_total_vector_count(StatsIndex(), "other") == 7
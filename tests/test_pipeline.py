@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("groq")  # imported by app.rag.pinecone_rag
+
+from app.rag import keyword_index, pinecone_rag, pipeline
+from app.rag.keyword_index import BM25Index
+
+BOOK_TEXT = {
+    "txt-0": "Habits are the compound interest of self-improvement.",
+    "txt-1": "The Two-Minute Rule: when you start a new habit, it should take less than two minutes to do.",
+    "txt-2": "Environment is the invisible hand that shapes human behavior.",
+}
+
+
+def test_failing_embedder_still_returns_keyword_hits(monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("embedding service down")
+
+    def unexpected(*args, **kwargs):
+        raise AssertionError("steps that need the query vector must be skipped")
+
+    monkeypatch.setattr(pinecone_rag, "get_embedding", fail)
+    monkeypatch.setattr(pinecone_rag, "classify", unexpected)
+    monkeypatch.setattr(pinecone_rag, "query_pinecone_user", unexpected)
+    monkeypatch.setattr(keyword_index, "HYBRID_SEARCH_ENABLED", True)
+    monkeypatch.setattr(keyword_index, "_keyword_index", BM25Index(BOOK_TEXT))
+
+    retrieval = asyncio.run(pipeline.retrieve_context("What is the two-minute rule?", [], None, None))
+
+    assert retrieval["label"] == "ATOMIC_HABITS"
+    assert retrieval["embedding"] is None
+    assert retrieval["context_ids"][0] == "txt-1"
+    assert "Two-Minute Rule" in retrieval["contexts"][0]
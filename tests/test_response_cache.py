@@ -0,0 +1,23 @@
+from app.rag.response_cache import SemanticResponseCache, cache_scope
+
+SYSTEM = {"role": "system", "content": "The email address of the interviewee is: a@example.com"}
+
+
+def test_answers_are_not_replayed_into_another_conversation():
+    cache = SemanticResponseCache(threshold=0.9)
+    first = [SYSTEM, {"role": "user", "content": "What is habit stacking?"},
+             {"role": "assistant", "content": "Pairing a new habit with a current one."}]
+    other = [SYSTEM, {"role": "user", "content": "What is the Two-Minute Rule?"},
+             {"role": "assistant", "content": "Start with a version that takes two minutes."}]
+
+    cache.store([1.0, 0.0], "ATOMIC_HABITS", ["7"], "More on stacking...", scope=cache_scope("ATOMIC_HABITS", None, first))
+    # The same follow-up ("say more about that") after different earlier turns
+    assert cache.lookup([1.0, 0.0], "ATOMIC_HABITS", ["7"], scope=cache_scope("ATOMIC_HABITS", None, other)) is None
+    assert cache.lookup([1.0, 0.0], "ATOMIC_HABITS", ["7"],
+                        scope=cache_scope("ATOMIC_HABITS", None, list(first))) == "More on stacking..."
+
+
+def test_personal_answers_need_a_user():
+    assert cache_scope("PERSONAL", None, [SYSTEM]) is None
+    assert cache_scope("PERSONAL", "u1", [SYSTEM]) != cache_scope("PERSONAL", "u2", [SYSTEM])
+    assert cache_scope("WEB_SEARCH", None, [SYSTEM]) != cache_scope("WEB_SEARCH", None, [])
@@ -0,0 +1,56 @@
+import pytest
+
+from app.functions.schedule_planner import SchedulePlanError, plan_schedule
+
+
+def test_levels_follow_dependencies(make_schedule):
+    schedule = make_schedule([
+        {"name": "Draft", "subtasks": [{"name": "Outline", "depends_on": ["Research"]}]},
+        {"name": "Research"},
+        {"name": "Publish", "depends_on": ["Draft", "Outline", "Draft"]},
+    ])
+    plan = plan_schedule(schedule)
+    names = [[plan.names[key] for key in level] for level in plan.levels]
+    assert names == [["Draft", "Research"], ["Outline"], ["Publish"]]
+    assert [[(plan.names[a], plan.names[b]) for a, b in edges] for edges in plan.edges_by_level()] == [
+        [("Outline", "Research")],
+        [("Publish", "Draft"), ("Publish", "Outline")],
+    ]
+
+
+def test_duplicate_names_without_references_are_allowed(make_schedule):
+    schedule = make_schedule(
+        [{"name": "Write chapter 1", "subtasks": [{"name": "Review"}]}],
+        [{"name": "Write chapter 2", "subtasks": [{"name": "Review", "depends_on": ["Write chapter 1"]}]}],
+    )
+    plan = plan_schedule(schedule)
+    assert plan.dependencies[(1, 0, 0)] == [(0, 0, None)]
+    assert list(plan.names.values()).count("Review") == 2
+
+
+def test_reference_to_duplicate_name_is_ambiguous(make_schedule):
+    schedule = make_schedule([
+        {"name": "A", "subtasks": [{"name": "Review"}]},
+        {"name": "B", "subtasks": [{"name": "Review"}]},
+        {"name": "Ship", "depends_on": ["Review"]},
+    ])
+    with pytest.raises(SchedulePlanError, match="'Ship' depends on 'Review', which names more than one"):
+        plan_schedule(schedule)
+
+
+def test_unknown_and_self_references_are_all_reported(make_schedule):
+    schedule = make_schedule([{"name": "A", "depends_on": ["Missing", "A"]}])
+    with pytest.raises(SchedulePlanError) as error:
+        plan_schedule(schedule)
+    assert error.value.problems == ["'A' depends on unknown task 'Missing'", "'A' depends on itself"]
+
+
+def test_cycle_is_reported_with_its_path(make_schedule):
+    schedule = make_schedule([
+        {"name": "A", "depends_on": ["C"]},
+        {"name": "B", "depends_on": ["A"]},
+        {"name": "C", "depends_on": ["B"]},
+        {"name": "D", "depends_on": ["A"]},
+    ])
+    with pytest.raises(SchedulePlanError, match="dependency cycle: A -> C -> B -> A"):
+        plan_schedule(schedule)
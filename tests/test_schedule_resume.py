@@ -0,0 +1,63 @@
+import os
+import asyncio
+import itertools
+from collections import Counter
+
+import httpx
+import pytest
+
+from app import clients
+from app.functions import schedule_clickup
+
+
+class FakeClickUp:
+    """Answers every create call with a new id; the fail_after-th POST times out."""
+
+    def __init__(self, fail_after=None):
+        self.ids = itertools.count(1)
+        self.fail_after = fail_after
+        self.posts = Counter()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if self.fail_after is not None and sum(self.posts.values()) == self.fail_after:
+            raise httpx.ReadTimeout("timed out", request=request)
+        self.posts[request.url.path.rsplit("/", 1)[-1]] += 1
+        return httpx.Response(200, json={"id": str(next(self.ids))})
+
+
+@pytest.fixture
+def run_with(monkeypatch):
+    """Run coro() on a fresh loop with ClickUp answered by fake; shared clients are restored afterwards."""
+    def run(fake, coro):
+        async def main():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(fake))
+            monkeypatch.setattr(clients, "_clients", {"async_http": client})
+            monkeypatch.setattr(clients, "_clients_pid", os.getpid())
+            # The limiter's semaphore belongs to the previous run's loop
+            monkeypatch.setattr(schedule_clickup, "_limiter", None)
+            await coro()
+        asyncio.run(main())
+    return run
+
+
+def test_rerun_reuses_recorded_ids(make_schedule, run_with):
+    schedule = make_schedule(
+        [{"name": "Draft", "subtasks": [{"name": "Outline"}]}, {"name": "Research"}],
+        [{"name": "Publish", "depends_on": ["Draft", "Research"]}],
+    )
+    clickup_ids = {}
+
+    def build():
+        return schedule_clickup.process_schedule("space", schedule, clickup_ids=clickup_ids)
+
+    first = FakeClickUp(fail_after=4)
+    with pytest.raises(httpx.ReadTimeout):
+        run_with(first, build)
+    assert clickup_ids["folder"] == "1"
+
+    second = FakeClickUp()
+    run_with(second, build)
+    # One folder, two lists, four tasks and subtasks and two dependencies in total, none created twice
+    assert sum(first.posts.values()) + sum(second.posts.values()) == 9
+    assert first.posts["folder"] + second.posts["folder"] == 1
+    assert len([ref for ref in clickup_ids if ref.startswith("dependency/")]) == 2
@@ -0,0 +1,25 @@
+import sys
+import importlib
+
+import pytest
+
+pytest.importorskip("flask")
+
+from app import main, warmup  # noqa: E402
+
+
+def test_wsgi_entry_point_starts_background_work(monkeypatch):
+    started = []
+    monkeypatch.setattr(main, "start_background_work", lambda: started.append(True))
+    monkeypatch.delitem(sys.modules, "app.wsgi", raising=False)
+    wsgi = importlib.import_module("app.wsgi")
+    assert started == [True]
+    assert wsgi.application is main.app
+
+
+def test_requests_do_not_start_warm_up(monkeypatch):
+    monkeypatch.setattr(warmup, "_started_pid", None)
+    monkeypatch.setattr(warmup, "start", lambda: pytest.fail("warm-up started by a request"))
+    response = main.app.test_client().get("/ready")
+    assert response.status_code == 503
+    assert response.get_json()["ready"] is False
@@ -0,0 +1,17 @@
+import msgspec
+
+from app.types.webhook import decode_webhook
+
+
+def test_null_fields_decode():
+    body = (b'{"message": {"type": "tool-calls", "toolCalls": [{"id": null, "function": {"name": "x"}}],'
+            b' "toolCall": {"name": "getRandomName", "parameters": null}, "assistant": {"metadata": null}}}')
+    message = decode_webhook(body).message
+    assert message.toolCalls[0].id is None
+    assert message.toolCall.parameters is None
+    assert message.assistant.metadata is None
+
+
+def test_model_output_is_kept_for_the_echo():
+    message = decode_webhook(b'{"message": {"type": "model-output", "output": {"text": "hi"}}}').message
+    assert msgspec.to_builtins(message)["output"] == {"text": "hi"}
@@ -0,0 +1,55 @@
+import asyncio
+import threading
+import time
+
+from app.wsgi_to_asgi import ThreadPoolWsgiToAsgi
+
+
+def serve(application, path="/", body=b"", headers=()):
+    """Run one http request through application; returns the sent ASGI messages."""
+    messages = []
+    chunks = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive():
+        return chunks.pop(0)
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "POST", "path": path, "query_string": b"a=1",
+             "headers": list(headers), "http_version": "1.1"}
+    return application(scope, receive, send), messages
+
+
+def test_request_and_streamed_response():
+    def wsgi_app(environ, start_response):
+        start_response("201 Created", [("Content-Type", "text/plain"), ("X-Seen", environ["HTTP_X_TEST"])])
+        yield environ["wsgi.input"].read()
+        yield environ["QUERY_STRING"].encode()
+
+    call, messages = serve(ThreadPoolWsgiToAsgi(wsgi_app), body=b"hi ", headers=[(b"x-test", b"yes")])
+    asyncio.run(call)
+    assert messages[0] == {"type": "http.response.start", "status": 201,
+                           "headers": [(b"content-type", b"text/plain"), (b"x-seen", b"yes")]}
+    assert b"".join(message["body"] for message in messages[1:]) == b"hi a=1"
+    assert messages[-1] == {"type": "http.response.body", "body": b""}
+
+
+def test_requests_run_concurrently():
+    threads = set()
+
+    def wsgi_app(environ, start_response):
+        threads.add(threading.get_ident())
+        time.sleep(0.3)
+        start_response("200 OK", [])
+        return [b"ok"]
+
+    application = ThreadPoolWsgiToAsgi(wsgi_app)
+
+    async def main():
+        await asyncio.gather(*(serve(application)[0] for _ in range(4)))
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    assert time.perf_counter() - start < 1.0
+    assert len(threads) == 4